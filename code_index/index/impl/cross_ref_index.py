@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Iterable, Iterator, TypeAlias
 
 from ...index.base import BaseIndex
@@ -16,6 +17,7 @@ from ...index.code_query import (
     QueryFullDefinition,
 )
 from ...models import (
+    CodeLocation,
     Definition,
     Function,
     FunctionLikeInfo,
@@ -111,7 +113,7 @@ class CrossRefIndex(BaseIndex):
     are referenced in the codebase.
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class Info:
         """Contains information about a function or method.
 
@@ -140,12 +142,30 @@ class CrossRefIndex(BaseIndex):
         def from_function_like_info(cls, func_like_info: FunctionLikeInfo) -> CrossRefIndex.Info:
             """Creates an Info object from a FunctionLikeInfo object."""
             info = cls()
-            for definition in func_like_info.definitions:
-                info.definitions[definition.to_pure()] = definition
-            for reference in func_like_info.references:
-                info.references[reference.to_pure()] = reference
+            info.bulk_insert(
+                definitions=func_like_info.definitions, references=func_like_info.references
+            )
             return info
 
+        def bulk_insert(
+            self,
+            *,
+            definitions: Iterable[Definition] = (),
+            references: Iterable[Reference] = (),
+        ) -> None:
+            """Inserts many definitions and references at once, replacing entries with equal keys.
+
+            Keys are derived from the values via ``to_pure()``, so the invariant holds by
+            construction and the per-item check in ``__setitem__`` is skipped by going through
+            ``dict.update``.
+
+            Args:
+                definitions: Definitions to insert.
+                references: References to insert.
+            """
+            self.definitions.update({d.to_pure(): d for d in definitions})
+            self.references.update({r.to_pure(): r for r in references})
+
         def update_from(self, other: CrossRefIndex.Info | FunctionLikeInfo):
             """Updates this Info object with data from another Info or FunctionLikeInfo.
 
@@ -173,8 +193,12 @@ class CrossRefIndex(BaseIndex):
         """Initializes an empty CrossRefIndex."""
         super().__init__()
         self.data: CrossRefIndex.Index = defaultdict(lambda: CrossRefIndex.Info())
-        # Mapping for fast reverse lookup: PureDefinition -> owning symbol
-        self._pure_def_to_symbol: dict[PureDefinition, Symbol] = {}
+        # Mapping for fast reverse lookup: definition location key -> owning symbol.
+        # Keys are (path_id, start_byte, end_byte) int tuples (see _definition_key), which hash
+        # much more cheaply than a PureDefinition with its nested CodeLocation.
+        self._def_key_to_symbol: dict[tuple[int, int, int], Symbol] = {}
+        # Interned file paths, used to turn a Path into a small int for the keys above
+        self._path_ids: dict[Path, int] = {}
         # The keys are Symbol objects (Function, Method).
         # The values are Info objects containing definitions and references.
         # Each Info object contains:
@@ -224,7 +248,7 @@ class CrossRefIndex(BaseIndex):
         # First, add the definition using merge_or_insert to conform to the invariant
         self.data[func_like].definitions.merge_or_insert(definition)
         # Maintain reverse mapping
-        self._pure_def_to_symbol[definition.to_pure()] = func_like
+        self._def_key_to_symbol[self._definition_key(definition.location)] = func_like
 
         # Now do cross-referencing: for each call this definition makes,
         # ensure this definition is in the called_by list of that reference
@@ -292,7 +316,15 @@ class CrossRefIndex(BaseIndex):
             # at the caller's def loc
             self.data[caller_func_like].definitions.merge_or_insert(cross_ref_definition)
             # Maintain reverse mapping for the caller's definition as it's inserted/merged here
-            self._pure_def_to_symbol[caller.definition] = caller_func_like
+            self._def_key_to_symbol[self._definition_key(caller.definition.location)] = (
+                caller_func_like
+            )
+
+    def clear(self) -> None:
+        """Removes all entries from the index in place, keeping the existing containers."""
+        self.data.clear()
+        self._def_key_to_symbol.clear()
+        self._path_ids.clear()
 
     def __len__(self) -> int:
         return len(self.data)
@@ -308,15 +340,15 @@ class CrossRefIndex(BaseIndex):
             self.__delitem__(func_like)
         self.data[func_like] = CrossRefIndex.Info.from_function_like_info(info)
         # Register mapping for all definitions of this symbol
-        for pure_def, definition in self.data[func_like].definitions.items():
-            self._pure_def_to_symbol[pure_def] = func_like
+        for pure_def in self.data[func_like].definitions:
+            self._def_key_to_symbol[self._definition_key(pure_def.location)] = func_like
 
     def __delitem__(self, func_like: Symbol):
         # Remove reverse mapping entries for this symbol's definitions
         info = self.data.get(func_like)
         if info is not None:
             for pure_def in list(info.definitions.keys()):
-                self._pure_def_to_symbol.pop(pure_def, None)
+                self._def_key_to_symbol.pop(self._definition_key(pure_def.location), None)
         self.data.pop(func_like)
 
     def __contains__(self, func_like: Symbol) -> bool:
@@ -372,9 +404,11 @@ class CrossRefIndex(BaseIndex):
         """Updates the index from a serialized IndexData object."""
         if data.type != "cross_ref_index":
             logger.warning(f"loading data with type {data.type} into CrossRefIndex")
+        # Replace each symbol's Info wholesale and rebuild the reverse mapping once at the end,
+        # rather than going through __setitem__, which purges and re-registers per entry.
+        from_function_like_info = CrossRefIndex.Info.from_function_like_info
         for entry in data.data:
-            self[entry.symbol] = entry.info
-        # After bulk load, recompute mapping to be safe
+            self.data[entry.symbol] = from_function_like_info(entry.info)
         self._recompute_pure_def_mapping()
         return self
 
@@ -467,28 +501,51 @@ class CrossRefIndex(BaseIndex):
 
         raise ValueError(f"Unsupported query type: {type(query)}")
 
+    def _definition_key(self, location: CodeLocation) -> tuple[int, int, int]:
+        """Build the reverse-mapping key of a definition location, interning its path.
+
+        Within one file, the byte span identifies a definition, so ``(path_id, start_byte,
+        end_byte)`` stands in for the full location. ``find_full_definition`` still confirms the
+        match against the owning symbol's ``PureDefinition``-keyed definitions.
+        """
+        path_id = self._path_ids.setdefault(location.file_path, len(self._path_ids))
+        return path_id, location.start_byte, location.end_byte
+
+    def _lookup_definition_owner(self, location: CodeLocation) -> Symbol | None:
+        """Look up the symbol owning a definition location without interning new paths."""
+        path_id = self._path_ids.get(location.file_path)
+        if path_id is None:
+            return None
+        return self._def_key_to_symbol.get((path_id, location.start_byte, location.end_byte))
+
     def _recompute_pure_def_mapping(self) -> None:
-        """Rebuild the PureDefinition -> Symbol reverse mapping."""
-        self._pure_def_to_symbol.clear()
-        for symbol, info in self.data.items():
-            for pure_def in info.definitions.keys():
-                self._pure_def_to_symbol[pure_def] = symbol
+        """Rebuild the definition location -> Symbol reverse mapping."""
+        definition_key = self._definition_key
+        self._def_key_to_symbol.clear()
+        self._def_key_to_symbol.update(
+            (definition_key(pure_def.location), symbol)
+            for symbol, info in self.data.items()
+            for pure_def in info.definitions
+        )
 
     def find_full_definition(
         self, pure_definition: PureDefinition
     ) -> tuple[Symbol, Definition] | None:
         """Fast resolve full Definition via maintained reverse mapping."""
-        symbol = self._pure_def_to_symbol.get(pure_definition)
+        location = pure_definition.location
+        symbol = self._lookup_definition_owner(location)
         if symbol is None:
             return None
-        definition = self.data[symbol].definitions.get(pure_definition)
+        info = self.data.get(symbol)
+        definition = info.definitions.get(pure_definition) if info is not None else None
         if definition is None:
-            # As a safety net, rebuild mapping once and retry
-            self._recompute_pure_def_mapping()
-            symbol = self._pure_def_to_symbol.get(pure_definition)
-            if symbol is None:
-                return None
-            definition = self.data[symbol].definitions.get(pure_definition)
-            if definition is None:
-                return None
+            # A miss only proves the entry stale if the owner no longer has a definition under
+            # this key; a query sharing the byte span but not the lines or columns must leave it.
+            key = self._definition_key(location)
+            definition_key = self._definition_key
+            if info is None or all(
+                definition_key(pure_def.location) != key for pure_def in info.definitions
+            ):
+                self._def_key_to_symbol.pop(key, None)
+            return None
         return symbol, definition
@@ -41,6 +41,14 @@ class SimpleIndex(BaseIndex):
         """Initializes an empty SimpleIndex."""
         super().__init__()
         self.data = defaultdict(lambda: FunctionLikeInfo())
+        # Inverted index for QueryByName: symbol name -> the keys of self.data with that name.
+        # The inner dict is used as an insertion-ordered set so removal is O(1).
+        self._symbols_by_name: defaultdict[str, dict[Symbol, None]] = defaultdict(dict)
+
+    def _index_name(self, func_like: Symbol):
+        """Records a key of self.data in the name index; call it before the key is inserted."""
+        if func_like not in self.data:
+            self._symbols_by_name[func_like.name][func_like] = None
 
     @override
     def __repr__(self):
@@ -49,10 +57,12 @@ class SimpleIndex(BaseIndex):
 
     @override
     def add_definition(self, func_like: Symbol, definition: Definition):
+        self._index_name(func_like)
         self.data[func_like].definitions.append(definition)
 
     @override
     def add_reference(self, func_like: Symbol, reference: Reference):
+        self._index_name(func_like)
         self.data[func_like].references.append(reference)
 
     @override
@@ -91,11 +101,16 @@ class SimpleIndex(BaseIndex):
     def __setitem__(self, func_like: Symbol, info: FunctionLikeInfo):
         if not isinstance(info, FunctionLikeInfo):
             raise TypeError("Value must be an instance of FunctionLikeInfo.")
+        self._index_name(func_like)
         self.data[func_like] = info
 
     @override
     def __delitem__(self, func_like: Symbol):
         self.data.__delitem__(func_like)
+        same_name = self._symbols_by_name[func_like.name]
+        del same_name[func_like]
+        if not same_name:
+            del self._symbols_by_name[func_like.name]
 
     @override
     def __contains__(self, func_like: Symbol) -> bool:
@@ -170,9 +185,10 @@ class SimpleIndex(BaseIndex):
                     return []
                 return [CodeQuerySingleResponse(func_like=func_like, info=info)]
             case QueryByName(name=name, type_filter=filter_option):
+                # .get avoids creating an empty entry for a name that is not indexed
                 func_likes = filter(
-                    lambda fl: fl.name == name and self._type_filterer(fl, filter_option),
-                    self.data.keys(),
+                    lambda fl: self._type_filterer(fl, filter_option),
+                    self._symbols_by_name.get(name, ()),
                 )
                 ret = []
                 for func_like in func_likes:
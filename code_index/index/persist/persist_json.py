@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 from ...models import IndexData
@@ -48,9 +49,15 @@ class SingleJsonFilePersistStrategy(PersistStrategy):
             raise ValueError(f"Parent path is not a directory: {parent_dir}")
 
         try:
-            # dump_index_to_json(data, path)
-            dumped_json_str = data.model_dump_json(indent=2, exclude_defaults=True)
-            path.write_text(dumped_json_str, encoding="utf-8")
+            dumped_json = data.model_dump_json(indent=2, exclude_defaults=True).encode()
+            # write to a sibling temp file and swap it in, so an interrupted save never leaves
+            # a truncated index behind
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            try:
+                tmp_path.write_bytes(dumped_json)
+                os.replace(tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
         except Exception as e:
             raise RuntimeError(f"Error saving index data to file {path}: {e}")
 
@@ -82,8 +89,9 @@ class SingleJsonFilePersistStrategy(PersistStrategy):
             raise ValueError(f"Path exists but is not a regular file: {path}")
 
         try:
-            json_str = path.read_text(encoding="utf-8")
-            return IndexData.model_validate_json(json_str)
+            # hand the raw UTF-8 bytes to pydantic-core, skipping a separate str decode pass
+            json_bytes = path.read_bytes()
+            return IndexData.model_validate_json(json_bytes, context={"path_cache": {}})
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"File {path} is not valid JSON: {e.msg}", e.doc, e.pos)
         except Exception as e:
@@ -1,16 +1,17 @@
 from enum import StrEnum
 from pathlib import Path
 from pprint import pprint
-from typing import Type, TypeVar
 
 from sqlalchemy import (
     Column,
+    Connection,
     ForeignKey,
     Integer,
     String,
     Table,
     UniqueConstraint,
     create_engine,
+    event,
     select,
 )
 from sqlalchemy.orm import (
@@ -19,6 +20,7 @@ from sqlalchemy.orm import (
     Session,
     mapped_column,
     relationship,
+    selectinload,
     sessionmaker,
 )
 
@@ -178,29 +180,73 @@ class OrmMetadata(Base):
     index_type: Mapped[str] = mapped_column(primary_key=True)
 
 
-T = TypeVar("T", bound=Base)
+LOCATION_COLUMNS = (
+    "file_path",
+    "start_lineno",
+    "start_col",
+    "end_lineno",
+    "end_col",
+    "start_byte",
+    "end_byte",
+)
+"""Columns of ``code_locations`` that together identify a location."""
+
+SYMBOL_COLUMNS = ("name", "class_name", "symbol_type")
+"""Columns of ``symbols`` that together identify a symbol."""
+
+BULK_WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+)
+"""PRAGMAs applied to the connections that write a fresh index database.
+
+``save`` always writes a newly created file, so there is nothing on disk for a rollback
+journal to protect: the journal is kept in memory and commits skip the fsyncs. Neither
+setting is stored in the file, which keeps the default DELETE journal mode, so a saved
+index can still be opened from a read-only location.
+"""
 
+MEMORY_CACHE_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+"""PRAGMAs keeping temporary storage and a 64 MiB page cache in memory while saving.
+
+Applied unless ``SqlitePersistStrategy`` is created with ``memory_pragmas=False``.
+"""
 
-# Helper function
-def get_or_create(session: Session, model_cls: Type[T], **kwargs) -> tuple[T, bool]:
-    """Gets an existing ORM instance or creates a new one.
 
-    Args:
-        session: SQLAlchemy session object.
-        model_cls: ORM model class.
-        **kwargs: Field parameters for querying or creating.
+class _SaveBatch:
+    """Rows of a single save, deduplicated in memory with pre-assigned primary keys.
 
-    Returns:
-        A tuple of (instance, created) where created is True if the
-        instance was newly created, False if it already existed.
+    Each table maps the natural key of a row to its id. Shared symbols, locations,
+    definitions and references are therefore written once and linked by id, without
+    querying the database for existing rows.
     """
-    instance = session.execute(select(model_cls).filter_by(**kwargs)).scalar_one_or_none()
-    if instance is not None:
-        return instance, False
-    else:
-        instance = model_cls(**kwargs)
-        session.add(instance)
-        return instance, True
+
+    def __init__(self) -> None:
+        self.symbols: dict[tuple, int] = {}
+        self.locations: dict[tuple, int] = {}
+        self.definitions: dict[tuple[int, int], int] = {}
+        self.references: dict[tuple[int, int], int] = {}
+        self.definition_references: dict[tuple[int, int], None] = {}
+
+    @staticmethod
+    def row_id(ids: dict, key: tuple) -> int:
+        """Returns the id assigned to ``key``, assigning the next free one on first use."""
+        row_id = ids.get(key)
+        if row_id is None:
+            row_id = ids[key] = len(ids) + 1
+        return row_id
+
+
+def _insert_rows(connection: Connection, table: Table, columns: tuple, ids: dict) -> None:
+    """Inserts the rows of one ``_SaveBatch`` table with a single Core executemany."""
+    if ids:
+        columns = ("id", *columns)
+        connection.execute(
+            table.insert(), [dict(zip(columns, (row_id, *key))) for key, row_id in ids.items()]
+        )
 
 
 class SqlitePersistStrategy(PersistStrategy):
@@ -210,14 +256,32 @@ class SqlitePersistStrategy(PersistStrategy):
     Supports both file-based and in-memory databases.
     """
 
-    def __init__(self):
-        """Initializes the SQLite persistence strategy."""
+    def __init__(self, memory_pragmas: bool = True):
+        """Initializes the SQLite persistence strategy.
+
+        Args:
+            memory_pragmas: If True, saving also applies ``MEMORY_CACHE_PRAGMAS``. Pass False
+                on memory-constrained hosts to keep SQLite's default temp store and cache.
+        """
         super().__init__()
+        self.memory_pragmas = memory_pragmas
         logger.debug("Initialized SqlitePersistStrategy")
 
     def __repr__(self):
         """Returns a string representation of the persistence strategy."""
-        return f"{self.__class__.__name__}()"
+        return f"{self.__class__.__name__}(memory_pragmas={self.memory_pragmas})"
+
+    def _apply_save_pragmas(self, dbapi_connection, _connection_record) -> None:
+        """``connect`` event hook applying the save PRAGMAs to a new connection."""
+        pragmas = BULK_WRITE_PRAGMAS
+        if self.memory_pragmas:
+            pragmas += MEMORY_CACHE_PRAGMAS
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
 
     def get_engine(self, path: Path | None = None, make_empty_db: bool = False):
         """Gets the SQLite database engine.
@@ -247,150 +311,111 @@ class SqlitePersistStrategy(PersistStrategy):
         return create_engine(f"sqlite:///{str(path.resolve())}")
 
     @staticmethod
-    def _func_like_as_criteria(func_like: Symbol) -> dict:
+    def _symbol_key(func_like: Symbol) -> tuple[str, str | None, SymbolType]:
+        """Returns the ``SYMBOL_COLUMNS`` values identifying a symbol."""
         match func_like:
             case Function(name=name):
-                return {"name": name, "class_name": None, "symbol_type": SymbolType.FUNCTION}
+                return name, None, SymbolType.FUNCTION
             case Method(name=name, class_name=class_name):
-                return {"name": name, "class_name": class_name, "symbol_type": SymbolType.METHOD}
+                return name, class_name, SymbolType.METHOD
         raise ValueError(
             f"Unsupported Symbol type: {type(func_like)}. Expected Function or Method."
         )
 
     @staticmethod
-    def _location_as_criteria(location: CodeLocation) -> dict:
-        """
-        将 CodeLocation 转换为查询条件字典。
-        """
-        return {
-            "file_path": str(location.file_path),
-            "start_lineno": location.start_lineno,
-            "start_col": location.start_col,
-            "end_lineno": location.end_lineno,
-            "end_col": location.end_col,
-            "start_byte": location.start_byte,
-            "end_byte": location.end_byte,
-        }
-
-    def _handle_definition_for_symbol(
-        self, session: Session, symbol_db: OrmSymbol, definition_dc: Definition
-    ):
-        # make location
-        loc_db, _ = get_or_create(
-            session,
-            OrmCodeLocation,
-            **self._location_as_criteria(definition_dc.location),
+    def _location_key(location: CodeLocation) -> tuple:
+        """Returns the ``LOCATION_COLUMNS`` values identifying a location."""
+        return (
+            str(location.file_path),
+            location.start_lineno,
+            location.start_col,
+            location.end_lineno,
+            location.end_col,
+            location.start_byte,
+            location.end_byte,
         )
 
-        # make definition
-        definition_db, _ = get_or_create(
-            session,
-            OrmDefinition,
-            symbol=symbol_db,  # this should add this definition to the symbol's definitions
-            location=loc_db,
+    def _symbol_location_ids(
+        self, batch: _SaveBatch, symbol: Symbol, location: CodeLocation
+    ) -> tuple[int, int]:
+        return (
+            batch.row_id(batch.symbols, self._symbol_key(symbol)),
+            batch.row_id(batch.locations, self._location_key(location)),
         )
 
+    def _handle_definition_for_symbol(
+        self, batch: _SaveBatch, symbol_id: int, definition_dc: Definition
+    ):
+        # make location and definition
+        location_id = batch.row_id(batch.locations, self._location_key(definition_dc.location))
+        definition_id = batch.row_id(batch.definitions, (symbol_id, location_id))
+
         # handle what this definition calls
         for func_ref in definition_dc.calls:
-            called_symbol_dc: Symbol = func_ref.symbol
-            called_reference_dc: PureReference = func_ref.reference
-
-            # make called symbol
-            called_symbol_db, _ = get_or_create(
-                session,
-                OrmSymbol,
-                **self._func_like_as_criteria(called_symbol_dc),
-            )
-            # make called location
-            called_location_db, _ = get_or_create(
-                session,
-                OrmCodeLocation,
-                **self._location_as_criteria(called_reference_dc.location),
-            )
-            # make called reference
-            called_reference_db, _ = get_or_create(
-                session,
-                OrmReference,
-                symbol=called_symbol_db,
-                location=called_location_db,
+            # make called symbol, location and reference
+            called_reference_id = batch.row_id(
+                batch.references,
+                self._symbol_location_ids(batch, func_ref.symbol, func_ref.reference.location),
             )
-
             # add the reference to the definition-reference relationship
-            if called_reference_db not in definition_db.internal_references:
-                definition_db.internal_references.append(called_reference_db)
+            batch.definition_references[(definition_id, called_reference_id)] = None
 
     def _handle_reference_for_symbol(
-        self, session: Session, symbol_db: OrmSymbol, reference_dc: Reference
+        self, batch: _SaveBatch, symbol_id: int, reference_dc: Reference
     ):
-        # make location
-        loc_db, _ = get_or_create(
-            session,
-            OrmCodeLocation,
-            **self._location_as_criteria(reference_dc.location),
-        )
-
-        # make reference
-        reference_db, _ = get_or_create(
-            session,
-            OrmReference,
-            symbol=symbol_db,  # this should add this reference to the symbol's references
-            location=loc_db,
-        )
+        # make location and reference
+        location_id = batch.row_id(batch.locations, self._location_key(reference_dc.location))
+        reference_id = batch.row_id(batch.references, (symbol_id, location_id))
 
         for func_def in reference_dc.called_by:
-            caller_symbol_dc: Symbol = func_def.symbol
-            caller_definition_dc: PureDefinition = func_def.definition
-
-            # make caller symbol
-            caller_symbol_db, _ = get_or_create(
-                session,
-                OrmSymbol,
-                **self._func_like_as_criteria(caller_symbol_dc),
-            )
-            # make caller location
-            caller_location_db, _ = get_or_create(
-                session,
-                OrmCodeLocation,
-                **self._location_as_criteria(caller_definition_dc.location),
+            # make caller symbol, location and definition
+            caller_definition_id = batch.row_id(
+                batch.definitions,
+                self._symbol_location_ids(batch, func_def.symbol, func_def.definition.location),
             )
-            # make caller definition
-            caller_definition_db, _ = get_or_create(
-                session,
-                OrmDefinition,
-                symbol=caller_symbol_db,
-                location=caller_location_db,
-            )
-
             # add the reference to the reference-definition relationship
-            if caller_definition_db not in reference_db.callers:
-                reference_db.callers.append(caller_definition_db)
+            batch.definition_references[(caller_definition_id, reference_id)] = None
 
-    def _handle_entry(self, session: Session, entry: IndexDataEntry):
-        symbol_dc: Symbol = entry.symbol
+    def _handle_entry(self, batch: _SaveBatch, entry: IndexDataEntry):
         info_dc: FunctionLikeInfo = entry.info
 
         # make symbol
-        symbol_criteria = self._func_like_as_criteria(symbol_dc)
-        symbol_db, _ = get_or_create(session, OrmSymbol, **symbol_criteria)
+        symbol_id = batch.row_id(batch.symbols, self._symbol_key(entry.symbol))
 
         # handle info of this symbol
         for definition_dc in info_dc.definitions:
-            self._handle_definition_for_symbol(session, symbol_db, definition_dc)
+            self._handle_definition_for_symbol(batch, symbol_id, definition_dc)
 
         # handle references of this symbol
         for reference_dc in info_dc.references:
-            self._handle_reference_for_symbol(session, symbol_db, reference_dc)
+            self._handle_reference_for_symbol(batch, symbol_id, reference_dc)
 
-    def _save(self, data: IndexData, session: Session):
-        index_type = data.type
-        index_data = data.data
+    def _save(self, data: IndexData, connection: Connection):
+        batch = _SaveBatch()
+        for entry in data.data:
+            self._handle_entry(batch, entry)
 
         # save metadata
-        metadata = OrmMetadata(index_type=index_type)
-        session.add(metadata)
-
-        for entry in index_data:
-            self._handle_entry(session, entry)
+        connection.execute(OrmMetadata.__table__.insert(), {"index_type": data.type})
+
+        # One executemany per table, parents first so that foreign keys resolve. Plain Core
+        # inserts skip the ORM unit of work: no instances or identity map are involved.
+        _insert_rows(connection, OrmSymbol.__table__, SYMBOL_COLUMNS, batch.symbols)
+        _insert_rows(connection, OrmCodeLocation.__table__, LOCATION_COLUMNS, batch.locations)
+        _insert_rows(
+            connection, OrmDefinition.__table__, ("symbol_id", "location_id"), batch.definitions
+        )
+        _insert_rows(
+            connection, OrmReference.__table__, ("symbol_id", "location_id"), batch.references
+        )
+        if batch.definition_references:
+            connection.execute(
+                definition_references_table.insert(),
+                [
+                    {"definition_id": definition_id, "reference_id": reference_id}
+                    for definition_id, reference_id in batch.definition_references
+                ],
+            )
 
     def save(self, data: IndexData, path: Path):
         """
@@ -401,17 +426,21 @@ class SqlitePersistStrategy(PersistStrategy):
         """
         engine = self.get_engine(path, make_empty_db=True)
         logger.debug("Created engine at {}", path)
-        Base.metadata.create_all(engine)
-        session_maker = sessionmaker(bind=engine)
-        session = session_maker()
+        event.listen(engine, "connect", self._apply_save_pragmas)
         try:
-            self._save(data, session)
-            session.commit()
+            Base.metadata.create_all(engine)
+            # engine.begin() commits on success and rolls back if anything raises
+            with engine.begin() as connection:
+                self._save(data, connection)
         except Exception as e:
-            session.rollback()
             raise RuntimeError(f"保存索引数据到 SQLite 数据库时出错：{e}")
         finally:
-            session.close()
+            # release the pooled connection now rather than when the engine is collected
+            engine.dispose()
+
+    # The loaders below build models with model_construct: every value comes from a database
+    # this strategy wrote from already-validated models, and the column types match the fields,
+    # so re-running validation would only repeat work.
 
     @staticmethod
     def _make_function_like(symbol_db: OrmSymbol) -> Symbol:
@@ -419,19 +448,18 @@ class SqlitePersistStrategy(PersistStrategy):
         根据 OrmSymbol 创建 Symbol 对象。
         """
         if symbol_db.symbol_type == SymbolType.FUNCTION:
-            return Function(name=symbol_db.name)
+            return Function.model_construct(name=symbol_db.name)
         elif symbol_db.symbol_type == SymbolType.METHOD:
-            return Method(name=symbol_db.name, class_name=symbol_db.class_name)
+            return Method.model_construct(name=symbol_db.name, class_name=symbol_db.class_name)
         else:
             raise ValueError(f"Unsupported symbol type: {symbol_db.symbol_type}")
 
-    def _handle_load_pure_reference(
-        self,
-        _session: Session,
-        ref_db: OrmReference,
-    ) -> PureReference:
-        loc_db = ref_db.location
-        location = CodeLocation(
+    @staticmethod
+    def _make_location(loc_db: OrmCodeLocation) -> CodeLocation:
+        """
+        根据 OrmCodeLocation 创建 CodeLocation 对象。
+        """
+        return CodeLocation.model_construct(
             file_path=Path(loc_db.file_path),
             start_lineno=loc_db.start_lineno,
             start_col=loc_db.start_col,
@@ -440,74 +468,50 @@ class SqlitePersistStrategy(PersistStrategy):
             start_byte=loc_db.start_byte,
             end_byte=loc_db.end_byte,
         )
-        return PureReference(location=location)
+
+    def _handle_load_pure_reference(
+        self,
+        _session: Session,
+        ref_db: OrmReference,
+    ) -> PureReference:
+        return PureReference.model_construct(location=self._make_location(ref_db.location))
 
     def _handle_load_pure_definition(
         self,
         session: Session,
         def_db: OrmDefinition,
     ) -> PureDefinition:
-        # get the location for this definition
-        loc_db = def_db.location
-        # create the definition object
-        return PureDefinition(
-            location=CodeLocation(
-                file_path=Path(loc_db.file_path),
-                start_lineno=loc_db.start_lineno,
-                start_col=loc_db.start_col,
-                end_lineno=loc_db.end_lineno,
-                end_col=loc_db.end_col,
-                start_byte=loc_db.start_byte,
-                end_byte=loc_db.end_byte,
-            )
-        )
+        # create the definition object from this definition's location
+        return PureDefinition.model_construct(location=self._make_location(def_db.location))
 
     def _handle_load_reference(self, _session: Session, ref_db: OrmReference) -> Reference:
-        loc_db = ref_db.location
-        location = CodeLocation(
-            file_path=Path(loc_db.file_path),
-            start_lineno=loc_db.start_lineno,
-            start_col=loc_db.start_col,
-            end_lineno=loc_db.end_lineno,
-            end_col=loc_db.end_col,
-            start_byte=loc_db.start_byte,
-            end_byte=loc_db.end_byte,
-        )
+        location = self._make_location(ref_db.location)
 
         called_by: list[SymbolDefinition] = []
         for def_db in ref_db.callers:
             called_by.append(
-                SymbolDefinition(
+                SymbolDefinition.model_construct(
                     symbol=self._make_function_like(def_db.symbol),
                     definition=self._handle_load_pure_definition(_session, def_db),
                 )
             )
 
-        return Reference(location=location, called_by=called_by)
+        return Reference.model_construct(location=location, called_by=called_by)
 
     def _handle_load_definition(self, session: Session, def_db: OrmDefinition) -> Definition:
         # get the location for this definition
-        loc_db = def_db.location
-        location = CodeLocation(
-            file_path=Path(loc_db.file_path),
-            start_lineno=loc_db.start_lineno,
-            start_col=loc_db.start_col,
-            end_lineno=loc_db.end_lineno,
-            end_col=loc_db.end_col,
-            start_byte=loc_db.start_byte,
-            end_byte=loc_db.end_byte,
-        )
+        location = self._make_location(def_db.location)
         # handle what this definition calls
         calls: list[SymbolReference] = []
         for ref_db in def_db.internal_references:
             calls.append(
-                SymbolReference(
+                SymbolReference.model_construct(
                     symbol=self._make_function_like(ref_db.symbol),
                     reference=self._handle_load_pure_reference(session, ref_db),
                 )
             )
         # create the definition object
-        return Definition(location=location, calls=calls)
+        return Definition.model_construct(location=location, calls=calls)
 
     def _handle_load_info_for_symbol(
         self, session: Session, symbol_db: OrmSymbol
@@ -525,7 +529,7 @@ class SqlitePersistStrategy(PersistStrategy):
             references.append(reference)
 
         # create the FunctionLikeInfo object
-        return FunctionLikeInfo(
+        return FunctionLikeInfo.model_construct(
             definitions=definitions,
             references=references,
         )
@@ -543,17 +547,33 @@ class SqlitePersistStrategy(PersistStrategy):
 
         index_type: str = metadata.index_type  # type: ignore
 
-        symbols = session.scalars(select(OrmSymbol)).all()
+        # Load every relationship the handlers walk up front, one SELECT per relationship
+        # instead of a lazy load per row. Symbols on the far side of a call link are all in
+        # the identity map by then, so their many-to-one lookups need no query.
+        symbols = session.scalars(
+            select(OrmSymbol).options(
+                selectinload(OrmSymbol.definitions).options(
+                    selectinload(OrmDefinition.location),
+                    selectinload(OrmDefinition.internal_references).selectinload(
+                        OrmReference.location
+                    ),
+                ),
+                selectinload(OrmSymbol.references).options(
+                    selectinload(OrmReference.location),
+                    selectinload(OrmReference.callers).selectinload(OrmDefinition.location),
+                ),
+            )
+        ).all()
         entries = []
         for symbol in symbols:
             entries.append(
-                IndexDataEntry(
+                IndexDataEntry.model_construct(
                     symbol=self._make_function_like(symbol),
                     info=self._handle_load_info_for_symbol(session, symbol),
                 )
             )
 
-        return IndexData(type=index_type, data=entries)
+        return IndexData.model_construct(type=index_type, data=entries)
 
     def load(self, path: Path) -> IndexData:
         """
@@ -573,6 +593,8 @@ class SqlitePersistStrategy(PersistStrategy):
             raise RuntimeError(f"从 SQLite 数据库加载索引数据时出错：{e}")
         finally:
             session.close()
+            # release the pooled connection now rather than when the engine is collected
+            engine.dispose()
 
 
 def demo_orm():
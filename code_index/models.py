@@ -5,10 +5,11 @@ references, definitions, and their relationships in a codebase.
 """
 
 from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, ClassVar, Literal, Mapping
 
-from pydantic import BaseModel, Field, model_serializer
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_serializer
 
 __all__ = [
     "CodeLocation",
@@ -27,7 +28,55 @@ __all__ = [
 ]
 
 
-class CodeLocation(BaseModel):
+class InstanceCacheModel(BaseModel):
+    """Base class for models that cache derived values in their instance ``__dict__``.
+
+    The cached values are only valid in the process that computed them (``str`` hashes are
+    randomized per process), so pickling and deep copies leave out the keys listed in
+    ``_instance_cache_keys`` and the copy recomputes them on demand.
+    """
+
+    _instance_cache_keys: ClassVar[tuple[str, ...]] = ()
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        state["__dict__"] = {
+            k: v for k, v in state["__dict__"].items() if k not in self._instance_cache_keys
+        }
+        return state
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None):
+        copied = super().__deepcopy__(memo)
+        for key in self._instance_cache_keys:
+            copied.__dict__.pop(key, None)
+        return copied
+
+
+class HashCachedModel(InstanceCacheModel):
+    """Base class for frozen models that are used heavily as dictionary keys.
+
+    The hash is computed from the field values on first use and stored on the instance,
+    so repeated dict and set operations do not re-walk the fields (and, for nested keys
+    such as ``PureDefinition``, the nested ``CodeLocation``).
+    """
+
+    _instance_cache_keys: ClassVar[tuple[str, ...]] = ("_hash",)
+
+    def __hash__(self) -> int:
+        h = self.__dict__.get("_hash")
+        if h is None:
+            h = hash(tuple(self.__dict__[name] for name in type(self).__pydantic_fields__))
+            self.__dict__["_hash"] = h
+        return h
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False):
+        """Copy the model, dropping the cached hash since ``update`` may change the fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_hash", None)
+        return copied
+
+
+class CodeLocation(HashCachedModel):
     """Represents a specific location in source code.
 
     Contains precise position information including line numbers, column positions,
@@ -51,6 +100,20 @@ class CodeLocation(BaseModel):
 
     model_config = {"frozen": True}
 
+    @field_validator("file_path", mode="after")
+    @classmethod
+    def _intern_file_path(cls, value: Path, info: ValidationInfo) -> Path:
+        """Reuse one Path object per distinct path when a ``path_cache`` dict is in the context.
+
+        Loading an index produces one location per definition and reference, mostly pointing
+        at a handful of files. Passing ``context={"path_cache": {}}`` to validation collapses
+        those duplicates into shared objects.
+        """
+        path_cache = (info.context or {}).get("path_cache")
+        if path_cache is None:
+            return value
+        return path_cache.setdefault(value, value)
+
     def __str__(self) -> str:
         """Return a string representation of the code location."""
         return f"CodeLocation({self.file_path}, {self.start_lineno}:{self.start_col}-{self.end_lineno}:{self.end_col}, {self.start_byte}-{self.end_byte})"
@@ -72,7 +135,7 @@ class SymbolType(StrEnum):
     """A method bound to a class."""
 
 
-class BaseSymbol(BaseModel):
+class BaseSymbol(HashCachedModel):
     """Base class for all code symbols.
 
     This class makes sure that all symbols have a ``type`` discriminator field
@@ -147,7 +210,7 @@ Example usage:
 """
 
 
-class PureReference(BaseModel):
+class PureReference(HashCachedModel):
     """A minimal, hashable fingerprint of a function or method reference.
 
     This class serves as a unique identifier containing only the essential
@@ -165,7 +228,7 @@ class PureReference(BaseModel):
     model_config = {"frozen": True}
 
 
-class PureDefinition(BaseModel):
+class PureDefinition(HashCachedModel):
     """A minimal, hashable fingerprint of a function or method definition.
 
     This class serves as a unique identifier containing only the essential
@@ -213,7 +276,7 @@ class SymbolDefinition(BaseModel):
     model_config = {"frozen": True}
 
 
-class Reference(BaseModel):
+class Reference(InstanceCacheModel):
     """Extended reference information with additional contextual data.
 
     This class inherits from PureReference (which serves as its fingerprint)
@@ -239,14 +302,27 @@ class Reference(BaseModel):
 
     model_config = {"frozen": True}
 
+    _instance_cache_keys: ClassVar[tuple[str, ...]] = ("_pure",)
+
+    @cached_property
+    def _pure(self) -> PureReference:
+        return PureReference(location=self.location)
+
     def to_pure(self) -> PureReference:
         """Extract the pure fingerprint of this reference for use as a dictionary key.
 
+        The fingerprint is computed once and cached on the instance. The cache is
+        dropped if ``location`` has been replaced since it was computed.
+
         Returns:
             A PureReference containing only the location information,
             suitable for hashing and fast lookups.
         """
-        return PureReference(location=self.location)
+        pure = self._pure
+        if pure.location is not self.location:
+            del self._pure
+            pure = self._pure
+        return pure
 
     @classmethod
     def from_pure(cls, pure_ref: PureReference) -> "Reference":
@@ -295,9 +371,15 @@ class Reference(BaseModel):
         if self.location != other.location:  # equivalent to PureReference equality
             raise ValueError("Cannot merge references with different PureReference locations.")
 
-        # Merge the call sites
-        for caller in other.called_by:
-            self.add_caller(caller)
+        # Merge the call sites in a single pass, keeping first-seen order
+        if not self.called_by:
+            self.called_by.extend(dict.fromkeys(other.called_by))
+        elif other.called_by:
+            seen = set(self.called_by)
+            for caller in other.called_by:
+                if caller not in seen:
+                    seen.add(caller)
+                    self.called_by.append(caller)
 
 
 class LLMNote(BaseModel):
@@ -327,7 +409,7 @@ class LLMNote(BaseModel):
     )
 
 
-class Definition(BaseModel):
+class Definition(InstanceCacheModel):
     """Extended definition information with additional contextual data.
 
     This class inherits from PureDefinition (which serves as its fingerprint)
@@ -361,14 +443,27 @@ class Definition(BaseModel):
         description="The source code of the definition. This field is only used when it is returned by a querying api, and is not saved in the index.",
     )
 
+    _instance_cache_keys: ClassVar[tuple[str, ...]] = ("_pure",)
+
+    @cached_property
+    def _pure(self) -> PureDefinition:
+        return PureDefinition(location=self.location)
+
     def to_pure(self) -> PureDefinition:
         """Extract the pure fingerprint of this definition for use as a dictionary key.
 
+        The fingerprint is computed once and cached on the instance. The cache is
+        dropped if ``location`` has been replaced since it was computed.
+
         Returns:
             A PureDefinition containing only the location information,
             suitable for hashing and fast lookups.
         """
-        return PureDefinition(location=self.location)
+        pure = self._pure
+        if pure.location is not self.location:
+            del self._pure
+            pure = self._pure
+        return pure
 
     @classmethod
     def from_pure(cls, pure_def: PureDefinition) -> "Definition":
@@ -433,9 +528,15 @@ class Definition(BaseModel):
         if self.doc is None:
             self.doc = other.doc
 
-        # Merge the calls
-        for callee in other.calls:
-            self.add_callee(callee)
+        # Merge the calls in a single pass, keeping first-seen order
+        if not self.calls:
+            self.calls.extend(dict.fromkeys(other.calls))
+        elif other.calls:
+            seen = set(self.calls)
+            for callee in other.calls:
+                if callee not in seen:
+                    seen.add(callee)
+                    self.calls.append(callee)
 
         # override llm_note with new one if it exists
         # to support updating the note
@@ -22,8 +22,10 @@ Functions:
 
 import json
 from dataclasses import fields, is_dataclass
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Type, TypeVar
+from typing import Any, Callable, Dict, Type, TypeVar
 
 from .logger import logger
 
@@ -52,21 +54,68 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         Raises:
             TypeError: If the object type is not supported by this encoder.
         """
-        # Convert Path objects to strings
-        if isinstance(o, Path):
-            return str(o)
-
-        # Convert dataclass objects to dictionaries with type information
-        if is_dataclass(o):
-            # Use manual field extraction to avoid recursion issues
-            dict_data = {f.name: getattr(o, f.name) for f in fields(o)}
-            dict_data["__class__"] = o.__class__.__name__  # Add type info for deserialization
-            return dict_data
+        # Look up the encoder by exact type; the MRO/dataclass check runs once per type
+        encode = _encoder_for_type(type(o))
+        if encode is not None:
+            return encode(o)
 
         # Fall back to default encoder for all other types
         return super().default(o)
 
 
+def _make_dataclass_encoder(cls: type) -> Callable[[Any], dict]:
+    """Build an encoder converting ``cls`` instances to dicts with type information.
+
+    The field names are resolved once here rather than on every encoded object.
+    """
+    names = tuple(f.name for f in fields(cls))
+    get_values = attrgetter(*names) if len(names) > 1 else None
+    class_name = cls.__name__
+
+    def encode(o) -> dict:
+        # Use manual field extraction to avoid recursion issues
+        if get_values is not None:
+            dict_data = dict(zip(names, get_values(o)))
+        else:
+            dict_data = {name: getattr(o, name) for name in names}
+        dict_data["__class__"] = class_name  # Add type info for deserialization
+        return dict_data
+
+    return encode
+
+
+@cache
+def _encoder_for_type(tp: type) -> Callable[[Any], Any] | None:
+    """Resolve how EnhancedJSONEncoder serializes instances of ``tp``.
+
+    Returns ``str`` for Path types, a dataclass encoder for dataclasses, and None for
+    anything else. The result only depends on the type itself, so it is memoized.
+    """
+    # Convert Path objects to strings
+    if issubclass(tp, Path):
+        return str
+    # Convert dataclass objects to dictionaries with type information
+    if is_dataclass(tp):
+        return _make_dataclass_encoder(tp)
+    return None
+
+
+@cache
+def _path_field_names(cls: type) -> frozenset[str]:
+    """Names of the fields of dataclass ``cls`` that are typed as Path."""
+    return frozenset(f.name for f in fields(cls) if f.type == Path)
+
+
+def _to_path(s: str, path_cache: dict[str, Path] | None) -> Path:
+    """Convert ``s`` to a Path, reusing the one already in ``path_cache`` if there is one."""
+    if path_cache is None:
+        return Path(s)
+    path = path_cache.get(s)
+    if path is None:
+        path = path_cache[s] = Path(s)
+    return path
+
+
 T = TypeVar("T")
 
 JSON_TYPE_REGISTRY: dict[str, Type[Any]] = {}
@@ -114,7 +163,9 @@ def register_json_type(cls: Type[T]) -> Type[T]:
     return cls
 
 
-def custom_json_decoder(dct: Dict, strict=False) -> object:
+def custom_json_decoder(
+    dct: Dict, strict=False, path_cache: dict[str, Path] | None = None
+) -> object:
     """Custom JSON decoder for reconstructing objects from dictionaries.
 
     This decoder handles the reconstruction of registered dataclass objects
@@ -124,6 +175,8 @@ def custom_json_decoder(dct: Dict, strict=False) -> object:
         dct: Dictionary containing serialized object data.
         strict: If True, raises exceptions when encountering unregistered classes.
             If False, returns the dictionary unchanged for unregistered types.
+        path_cache: Optional dict shared by the calls of one decode. Path strings seen
+            before map to the same Path object instead of a new one per record.
 
     Returns:
         The reconstructed object if type information is available and registered,
@@ -140,7 +193,7 @@ def custom_json_decoder(dct: Dict, strict=False) -> object:
     """
     # Handle Path objects stored as strings
     if "file_path" in dct and isinstance(dct["file_path"], str):
-        dct["file_path"] = Path(dct["file_path"])
+        dct["file_path"] = _to_path(dct["file_path"], path_cache)
 
     # Handle registered dataclass objects
     if "__class__" in dct:
@@ -151,14 +204,9 @@ def custom_json_decoder(dct: Dict, strict=False) -> object:
                 raise ValueError(f"Class {class_name} not registered in JSON_TYPE_REGISTRY.")
         elif is_dataclass(cls):
             # Convert string paths to Path objects for fields typed as Path
-            for field_info in fields(cls):
-                field_name = field_info.name
-                if (
-                    field_name in dct
-                    and isinstance(dct[field_name], str)
-                    and field_info.type == Path
-                ):
-                    dct[field_name] = Path(dct[field_name])
+            for field_name in _path_field_names(cls):
+                if field_name in dct and isinstance(dct[field_name], str):
+                    dct[field_name] = _to_path(dct[field_name], path_cache)
             # noinspection PyArgumentList
             return cls(**dct)
     return dct  # Return original dictionary if no matching class found
@@ -209,6 +257,8 @@ def load_index_from_json(input_path: Path, strict=False):
         >>> data = load_index_from_json(Path("index.json"))
         >>> # Returns properly typed objects based on registry
     """
+    # one cache per load, so the shared Paths are freed together with the loaded data
+    path_cache: dict[str, Path] = {}
     with input_path.open("r", encoding="utf-8") as f:
-        data = json.load(f, object_hook=lambda dct: custom_json_decoder(dct, strict))
+        data = json.load(f, object_hook=lambda dct: custom_json_decoder(dct, strict, path_cache))
     return data
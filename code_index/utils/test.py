@@ -75,20 +75,8 @@ def normalize_dataclass_for_comparison(obj: Any) -> Any:
         >>> normalized["items"]
         ["a", "b"]  # Sorted for consistent comparison
     """
-    if isinstance(obj, BaseModel):
-        # Convert Pydantic model to dictionary
-        result = obj.model_dump()
-        # Recursively process dictionary values
-        return {k: normalize_dataclass_for_comparison(v) for k, v in result.items()}
-    if dataclasses.is_dataclass(obj):
-        # Convert dataclass to dictionary
-        # assert it is an instance of dataclass, not a class
-        if isinstance(obj, type):
-            raise TypeError("Expected an instance of a dataclass, not a class.")
-        result = dataclasses.asdict(obj)
-        # Recursively process dictionary values
-        return {k: normalize_dataclass_for_comparison(v) for k, v in result.items()}
-    elif isinstance(obj, dict):
+    # Below the top-level model everything is plain dicts and lists, so test those first
+    if isinstance(obj, dict):
         # Recursively process dictionaries
         return {k: normalize_dataclass_for_comparison(v) for k, v in obj.items()}
     elif isinstance(obj, (list, tuple, set)):
@@ -100,6 +88,19 @@ def normalize_dataclass_for_comparison(obj: Any) -> Any:
         except (TypeError, KeyError):
             # If sorting fails, maintain original order
             return items
+    elif isinstance(obj, BaseModel):
+        # Convert Pydantic model to dictionary
+        result = obj.model_dump()
+        # Recursively process dictionary values
+        return {k: normalize_dataclass_for_comparison(v) for k, v in result.items()}
+    elif dataclasses.is_dataclass(obj):
+        # Convert dataclass to dictionary
+        # assert it is an instance of dataclass, not a class
+        if isinstance(obj, type):
+            raise TypeError("Expected an instance of a dataclass, not a class.")
+        result = dataclasses.asdict(obj)
+        # Recursively process dictionary values
+        return {k: normalize_dataclass_for_comparison(v) for k, v in result.items()}
     elif isinstance(obj, Path):
         # Normalize paths
         return normalize_path(obj)
@@ -218,6 +219,9 @@ def compare_index_data(data1: IndexData, data2: IndexData) -> Tuple[bool, list[s
     try:
         normalized1 = normalize_index_data_for_comparison(data1)
         normalized2 = normalize_index_data_for_comparison(data2)
+        # Equal normalized forms need no per-field diff walk
+        if normalized1 == normalized2:
+            return True, []
 
         # Recursive value comparison with detailed difference tracking
         def compare_values(v1: Any, v2: Any, path: str = "") -> list[str]:
@@ -1,5 +1,6 @@
 """Tests for CrossRefIndex and related classes."""
 
+import re
 from pathlib import Path
 
 import pytest
@@ -29,6 +30,16 @@ from code_index.models import (
     SymbolReference,
 )
 
+# The tests share a module-scoped index (see ``_shared_index``), so under pytest-xdist
+# (``-n auto --dist loadgroup``) they must all run on the same worker.
+pytestmark = pytest.mark.xdist_group("cross_ref_index")
+
+_INVARIANT_RE = re.compile(r"Key .* does not match value\.to_pure\(\)")
+"""Expected error message when a dict key does not match ``value.to_pure()``."""
+
+_INVALID_REGEX_RE = re.compile(r"Invalid regex pattern")
+"""Expected error message when a name-regex query cannot be compiled."""
+
 
 @pytest.fixture
 def sample_location():
@@ -70,6 +81,12 @@ def sample_method():
     return Method(name="test_method", class_name="TestClass")
 
 
+@pytest.fixture(scope="module")
+def _shared_index():
+    """A single CrossRefIndex instance reused across the tests of this module."""
+    return CrossRefIndex()
+
+
 def make_position(
     file_path, start_lineno, start_col, end_lineno, end_col, start_byte, end_byte
 ) -> CodeLocation:
@@ -85,6 +102,26 @@ def make_position(
     )
 
 
+def _def(location: CodeLocation, **kwargs) -> Definition:
+    """Build a Definition from known-good test inputs without running validation."""
+    return Definition.model_construct(location=location, **kwargs)
+
+
+def _ref(location: CodeLocation, **kwargs) -> Reference:
+    """Build a Reference from known-good test inputs without running validation."""
+    return Reference.model_construct(location=location, **kwargs)
+
+
+def _pdef(location: CodeLocation) -> PureDefinition:
+    """Build a PureDefinition from a known-good location without running validation."""
+    return PureDefinition.model_construct(location=location)
+
+
+def _pref(location: CodeLocation) -> PureReference:
+    """Build a PureReference from a known-good location without running validation."""
+    return PureReference.model_construct(location=location)
+
+
 class TestReferenceDict:
     """Tests for ReferenceDict class."""
 
@@ -101,13 +138,13 @@ class TestReferenceDict:
 
         # This should fail - key doesn't match value.to_pure()
         wrong_pure_ref = PureReference(location=sample_location2)
-        with pytest.raises(ValueError, match="Key .* does not match value.to_pure()"):
+        with pytest.raises(ValueError, match=_INVARIANT_RE):
             ref_dict[wrong_pure_ref] = reference
 
     def test_auto_creation_on_missing_key(self, sample_location):
         """Test that missing keys automatically create new Reference objects."""
         ref_dict = ReferenceDict()
-        pure_ref = PureReference(location=sample_location)
+        pure_ref = _pref(sample_location)
 
         # Accessing non-existent key should create new Reference
         reference = ref_dict[pure_ref]
@@ -120,16 +157,12 @@ class TestReferenceDict:
         """Test merge_or_insert with a new entry."""
         ref_dict = ReferenceDict()
 
-        symbol_def = SymbolDefinition(
-            symbol=sample_function, definition=PureDefinition(location=sample_location)
-        )
-        reference = Reference(location=sample_location, called_by=[symbol_def])
+        symbol_def = SymbolDefinition(symbol=sample_function, definition=_pdef(sample_location))
+        reference = _ref(sample_location, called_by=[symbol_def])
 
         ref_dict.merge_or_insert(reference)
 
-        pure_ref = reference.to_pure()
-        assert pure_ref in ref_dict
-        assert ref_dict[pure_ref].called_by == [symbol_def]
+        assert list(ref_dict.values()) == [reference]
 
     def test_merge_or_insert_existing_entry(
         self, sample_location, sample_function, sample_location2
@@ -138,18 +171,16 @@ class TestReferenceDict:
         ref_dict = ReferenceDict()
 
         # Create first reference with one caller
-        symbol_def1 = SymbolDefinition(
-            symbol=sample_function, definition=PureDefinition(location=sample_location)
-        )
-        reference1 = Reference(location=sample_location, called_by=[symbol_def1])
+        symbol_def1 = SymbolDefinition(symbol=sample_function, definition=_pdef(sample_location))
+        reference1 = _ref(sample_location, called_by=[symbol_def1])
         ref_dict.merge_or_insert(reference1)
 
         # Create second reference with another caller
         symbol_def2 = SymbolDefinition(
             symbol=Function(name="another_func"),
-            definition=PureDefinition(location=sample_location2),
+            definition=_pdef(sample_location2),
         )
-        reference2 = Reference(location=sample_location, called_by=[symbol_def2])
+        reference2 = _ref(sample_location, called_by=[symbol_def2])
         ref_dict.merge_or_insert(reference2)
 
         # Should have merged the called_by lists
@@ -159,6 +190,33 @@ class TestReferenceDict:
         assert symbol_def1 in merged_ref.called_by
         assert symbol_def2 in merged_ref.called_by
 
+    def test_merge_or_insert_empty_called_by(self, sample_location, sample_function):
+        """Test that merging a reference without callers leaves the existing callers intact."""
+        ref_dict = ReferenceDict()
+        symbol_def = SymbolDefinition(symbol=sample_function, definition=_pdef(sample_location))
+        ref_dict.merge_or_insert(_ref(sample_location, called_by=[symbol_def]))
+
+        ref_dict.merge_or_insert(_ref(sample_location))
+
+        assert ref_dict[_pref(sample_location)].called_by == [symbol_def]
+
+    def test_merge_or_insert_deduplicates_in_order(
+        self, sample_location, sample_function, sample_location2
+    ):
+        """Test that merging keeps first-seen order and drops repeated callers."""
+        ref_dict = ReferenceDict()
+        symbol_def1 = SymbolDefinition(symbol=sample_function, definition=_pdef(sample_location))
+        symbol_def2 = SymbolDefinition(
+            symbol=Function(name="another_func"),
+            definition=_pdef(sample_location2),
+        )
+        ref_dict.merge_or_insert(_ref(sample_location, called_by=[symbol_def1, symbol_def1]))
+
+        ref_dict.merge_or_insert(_ref(sample_location, called_by=[symbol_def2, symbol_def1]))
+
+        merged_ref = ref_dict[_pref(sample_location)]
+        assert merged_ref.called_by == [symbol_def1, symbol_def2]
+
 
 class TestDefinitionDict:
     """Tests for DefinitionDict class."""
@@ -176,13 +234,13 @@ class TestDefinitionDict:
 
         # This should fail - key doesn't match value.to_pure()
         wrong_pure_def = PureDefinition(location=sample_location2)
-        with pytest.raises(ValueError, match="Key .* does not match value.to_pure()"):
+        with pytest.raises(ValueError, match=_INVARIANT_RE):
             def_dict[wrong_pure_def] = definition
 
     def test_auto_creation_on_missing_key(self, sample_location):
         """Test that missing keys automatically create new Definition objects."""
         def_dict = DefinitionDict()
-        pure_def = PureDefinition(location=sample_location)
+        pure_def = _pdef(sample_location)
 
         # Accessing non-existent key should create new Definition
         definition = def_dict[pure_def]
@@ -195,16 +253,12 @@ class TestDefinitionDict:
         """Test merge_or_insert with a new entry."""
         def_dict = DefinitionDict()
 
-        symbol_ref = SymbolReference(
-            symbol=sample_function, reference=PureReference(location=sample_location)
-        )
-        definition = Definition(location=sample_location, calls=[symbol_ref])
+        symbol_ref = SymbolReference(symbol=sample_function, reference=_pref(sample_location))
+        definition = _def(sample_location, calls=[symbol_ref])
 
         def_dict.merge_or_insert(definition)
 
-        pure_def = definition.to_pure()
-        assert pure_def in def_dict
-        assert def_dict[pure_def].calls == [symbol_ref]
+        assert list(def_dict.values()) == [definition]
 
     def test_merge_or_insert_existing_entry(
         self, sample_location, sample_function, sample_location2
@@ -213,17 +267,15 @@ class TestDefinitionDict:
         def_dict = DefinitionDict()
 
         # Create first definition with one call
-        symbol_ref1 = SymbolReference(
-            symbol=sample_function, reference=PureReference(location=sample_location)
-        )
-        definition1 = Definition(location=sample_location, calls=[symbol_ref1])
+        symbol_ref1 = SymbolReference(symbol=sample_function, reference=_pref(sample_location))
+        definition1 = _def(sample_location, calls=[symbol_ref1])
         def_dict.merge_or_insert(definition1)
 
         # Create second definition with another call
         symbol_ref2 = SymbolReference(
-            symbol=Function(name="another_func"), reference=PureReference(location=sample_location2)
+            symbol=Function(name="another_func"), reference=_pref(sample_location2)
         )
-        definition2 = Definition(location=sample_location, calls=[symbol_ref2])
+        definition2 = _def(sample_location, calls=[symbol_ref2])
         def_dict.merge_or_insert(definition2)
 
         # Should have merged the calls lists
@@ -233,17 +285,42 @@ class TestDefinitionDict:
         assert symbol_ref1 in merged_def.calls
         assert symbol_ref2 in merged_def.calls
 
+    def test_to_pure_is_cached_across_merges(
+        self, sample_location, sample_function, sample_location2
+    ):
+        """Test that to_pure() is reused after merges and recomputed when location changes."""
+        def_dict = DefinitionDict()
+        symbol_ref = SymbolReference(symbol=sample_function, reference=_pref(sample_location2))
+        def_dict.merge_or_insert(_def(sample_location))
+        stored = def_dict[_pdef(sample_location)]
+        pure_before = stored.to_pure()
+
+        def_dict.merge_or_insert(_def(sample_location, calls=[symbol_ref]))
+
+        assert stored.to_pure() is pure_before
+
+        stored.location = sample_location2
+        assert stored.to_pure() == _pdef(sample_location2)
+
 
 class TestCrossRefIndexInfo:
     """Tests for CrossRefIndex.Info class."""
 
+    def test_uses_slots(self):
+        """Test that Info is a slotted container without a per-instance __dict__."""
+        info = CrossRefIndex.Info()
+
+        assert not hasattr(info, "__dict__")
+        assert isinstance(info.definitions, DefinitionDict)
+        assert isinstance(info.references, ReferenceDict)
+
     def test_to_function_like_info(self, sample_location, sample_function):
         """Test conversion to FunctionLikeInfo."""
         info = CrossRefIndex.Info()
 
         # Add a definition and reference
-        definition = Definition(location=sample_location)
-        reference = Reference(location=sample_location)
+        definition = _def(sample_location)
+        reference = _ref(sample_location)
 
         pure_def = definition.to_pure()
         pure_ref = reference.to_pure()
@@ -261,8 +338,8 @@ class TestCrossRefIndexInfo:
 
     def test_from_function_like_info(self, sample_location):
         """Test creation from FunctionLikeInfo."""
-        definition = Definition(location=sample_location)
-        reference = Reference(location=sample_location)
+        definition = _def(sample_location)
+        reference = _ref(sample_location)
 
         func_like_info = FunctionLikeInfo(definitions=[definition], references=[reference])
 
@@ -279,17 +356,14 @@ class TestCrossRefIndexInfo:
         info2 = CrossRefIndex.Info()
 
         # Add different items to each info
-        def1 = Definition(location=sample_location)
-        ref1 = Reference(location=sample_location)
-
-        def2 = Definition(location=sample_location2)
-        ref2 = Reference(location=sample_location2)
+        def1 = _def(sample_location)
+        ref1 = _ref(sample_location)
 
-        info1.definitions[def1.to_pure()] = def1
-        info1.references[ref1.to_pure()] = ref1
+        def2 = _def(sample_location2)
+        ref2 = _ref(sample_location2)
 
-        info2.definitions[def2.to_pure()] = def2
-        info2.references[ref2.to_pure()] = ref2
+        info1.bulk_insert(definitions=[def1], references=[ref1])
+        info2.bulk_insert(definitions=[def2], references=[ref2])
 
         # Update info1 with info2
         info1.update_from(info2)
@@ -301,17 +375,36 @@ class TestCrossRefIndexInfo:
         assert ref1.to_pure() in info1.references
         assert ref2.to_pure() in info1.references
 
+    def test_bulk_insert(self, sample_location, sample_location2, sample_function):
+        """Test that bulk_insert keys entries by to_pure() and replaces equal keys."""
+        info = CrossRefIndex.Info()
+        def1 = _def(sample_location)
+        def2 = _def(sample_location2)
+        ref1 = _ref(sample_location)
+
+        info.bulk_insert(definitions=[def1, def2], references=[ref1])
+
+        assert info.definitions == {def1.to_pure(): def1, def2.to_pure(): def2}
+        assert info.references == {ref1.to_pure(): ref1}
+
+        # a second insert with the same key replaces rather than merges
+        symbol_def = SymbolDefinition(symbol=sample_function, definition=_pdef(sample_location2))
+        ref1_called = _ref(sample_location, called_by=[symbol_def])
+        info.bulk_insert(references=[ref1_called])
+
+        assert info.references == {ref1.to_pure(): ref1_called}
+
     def test_update_from_function_like_info(self, sample_location, sample_location2):
         """Test updating from FunctionLikeInfo."""
         info = CrossRefIndex.Info()
 
         # Add initial items
-        def1 = Definition(location=sample_location)
+        def1 = _def(sample_location)
         info.definitions[def1.to_pure()] = def1
 
         # Create FunctionLikeInfo with new items
-        def2 = Definition(location=sample_location2)
-        ref2 = Reference(location=sample_location2)
+        def2 = _def(sample_location2)
+        ref2 = _ref(sample_location2)
 
         func_like_info = FunctionLikeInfo(definitions=[def2], references=[ref2])
 
@@ -328,36 +421,54 @@ class TestCrossRefIndexInfo:
 class TestCrossRefIndex:
     """Tests for CrossRefIndex class."""
 
-    def test_initialization(self):
+    @pytest.fixture
+    def index(self, _shared_index):
+        """The shared index, reset to empty before each test."""
+        _shared_index.clear()
+        return _shared_index
+
+    def test_initialization(self, index):
         """Test CrossRefIndex initialization."""
-        index = CrossRefIndex()
         assert len(index) == 0
         assert isinstance(index.data, dict)
 
-    def test_add_definition_simple(self, sample_function, sample_location):
+    def test_clear(self, index, sample_function, sample_location, sample_location2):
+        """Test that clear() empties both the data and the reverse definition mapping."""
+        symbol_def = SymbolDefinition(
+            symbol=Function(name="caller"), definition=_pdef(sample_location2)
+        )
+        index.add_definition(sample_function, _def(sample_location))
+        index.add_reference(sample_function, _ref(sample_location2, called_by=[symbol_def]))
+        assert len(index) == 2
+
+        data, mapping = index.data, index._def_key_to_symbol
+        index.clear()
+
+        assert len(index) == 0
+        assert index._def_key_to_symbol == {}
+        assert index._path_ids == {}
+        # containers are reset in place rather than rebound
+        assert index.data is data
+        assert index._def_key_to_symbol is mapping
+        assert index.find_full_definition(_pdef(sample_location)) is None
+
+    def test_add_definition_simple(self, index, sample_function, sample_location):
         """Test adding a simple definition without calls."""
-        index = CrossRefIndex()
-        definition = Definition(location=sample_location)
+        definition = _def(sample_location)
 
         index.add_definition(sample_function, definition)
 
-        assert sample_function in index
         info = index.get_info(sample_function)
-        assert len(info.definitions) == 1
-        assert definition in info.definitions
+        assert info.definitions == [definition]
 
-    def test_add_definition_with_cross_reference(self, sample_location, sample_location2):
+    def test_add_definition_with_cross_reference(self, index, sample_location, sample_location2):
         """Test adding a definition with cross-reference to another function."""
-        index = CrossRefIndex()
-
         caller_func = Function(name="caller")
         called_func = Function(name="called")
 
         # Create a definition that calls another function
-        symbol_ref = SymbolReference(
-            symbol=called_func, reference=PureReference(location=sample_location2)
-        )
-        caller_definition = Definition(location=sample_location, calls=[symbol_ref])
+        symbol_ref = SymbolReference(symbol=called_func, reference=_pref(sample_location2))
+        caller_definition = _def(sample_location, calls=[symbol_ref])
 
         # Add the definition
         index.add_definition(caller_func, caller_definition)
@@ -372,7 +483,7 @@ class TestCrossRefIndex:
         assert len(called_info.references) == 1
 
         # The called function should have this reference in its references
-        called_ref = list(called_info.references)[0]
+        called_ref = called_info.references[0]
         assert called_ref.location == sample_location2
 
         # The reference should show that it's called by the caller function
@@ -381,30 +492,23 @@ class TestCrossRefIndex:
         assert symbol_def.symbol == caller_func
         assert symbol_def.definition == caller_definition.to_pure()
 
-    def test_add_reference_simple(self, sample_function, sample_location):
+    def test_add_reference_simple(self, index, sample_function, sample_location):
         """Test adding a simple reference without callers."""
-        index = CrossRefIndex()
-        reference = Reference(location=sample_location)
+        reference = _ref(sample_location)
 
         index.add_reference(sample_function, reference)
 
-        assert sample_function in index
         info = index.get_info(sample_function)
-        assert len(info.references) == 1
-        assert reference in info.references
+        assert info.references == [reference]
 
-    def test_add_reference_with_cross_reference(self, sample_location, sample_location2):
+    def test_add_reference_with_cross_reference(self, index, sample_location, sample_location2):
         """Test adding a reference with cross-reference to caller function."""
-        index = CrossRefIndex()
-
         caller_func = Function(name="caller")
         called_func = Function(name="called")
 
         # Create a reference that is called by another function
-        symbol_def = SymbolDefinition(
-            symbol=caller_func, definition=PureDefinition(location=sample_location)
-        )
-        called_reference = Reference(location=sample_location2, called_by=[symbol_def])
+        symbol_def = SymbolDefinition(symbol=caller_func, definition=_pdef(sample_location))
+        called_reference = _ref(sample_location2, called_by=[symbol_def])
 
         # Add the reference
         index.add_reference(called_func, called_reference)
@@ -419,7 +523,7 @@ class TestCrossRefIndex:
         assert len(caller_info.definitions) == 1
 
         # The caller function should have this call in its definitions
-        caller_def = list(caller_info.definitions)[0]
+        caller_def = caller_info.definitions[0]
         assert caller_def.location == sample_location
 
         # The definition should show that it calls the called function
@@ -428,24 +532,18 @@ class TestCrossRefIndex:
         assert symbol_ref.symbol == called_func
         assert symbol_ref.reference == called_reference.to_pure()
 
-    def test_bidirectional_cross_reference(self, sample_location, sample_location2):
+    def test_bidirectional_cross_reference(self, index, sample_location, sample_location2):
         """Test that adding both definition and reference creates proper bidirectional links."""
-        index = CrossRefIndex()
-
         func_a = Function(name="func_a")
         func_b = Function(name="func_b")
 
         # func_a calls func_b
-        symbol_ref = SymbolReference(
-            symbol=func_b, reference=PureReference(location=sample_location2)
-        )
-        definition_a = Definition(location=sample_location, calls=[symbol_ref])
+        symbol_ref = SymbolReference(symbol=func_b, reference=_pref(sample_location2))
+        definition_a = _def(sample_location, calls=[symbol_ref])
 
         # func_b is called by func_a
-        symbol_def = SymbolDefinition(
-            symbol=func_a, definition=PureDefinition(location=sample_location)
-        )
-        reference_b = Reference(location=sample_location2, called_by=[symbol_def])
+        symbol_def = SymbolDefinition(symbol=func_a, definition=_pdef(sample_location))
+        reference_b = _ref(sample_location2, called_by=[symbol_def])
 
         # Add both
         index.add_definition(func_a, definition_a)
@@ -457,20 +555,19 @@ class TestCrossRefIndex:
 
         # func_a should have definition that calls func_b
         assert len(info_a.definitions) == 1
-        def_a = list(info_a.definitions)[0]
+        def_a = info_a.definitions[0]
         assert len(def_a.calls) == 1
         assert def_a.calls[0].symbol == func_b
 
         # func_b should have reference that is called by func_a
         assert len(info_b.references) == 1
-        ref_b = list(info_b.references)[0]
+        ref_b = info_b.references[0]
         assert len(ref_b.called_by) == 1
         assert ref_b.called_by[0].symbol == func_a
 
-    def test_query_by_key(self, sample_function, sample_location):
+    def test_query_by_key(self, index, sample_function, sample_location):
         """Test querying by specific function key."""
-        index = CrossRefIndex()
-        definition = Definition(location=sample_location)
+        definition = _def(sample_location)
         index.add_definition(sample_function, definition)
 
         query = QueryByKey(func_like=sample_function)
@@ -480,68 +577,44 @@ class TestCrossRefIndex:
         assert results[0].func_like == sample_function
         assert len(results[0].info.definitions) == 1
 
-    def test_query_by_name_function(self, sample_location):
-        """Test querying by function name."""
-        index = CrossRefIndex()
-        func1 = Function(name="test_func")
-        func2 = Function(name="other_func")
-        method1 = Method(name="test_func", class_name="TestClass")
-
-        index.add_definition(func1, Definition(location=sample_location))
-        index.add_definition(func2, Definition(location=sample_location))
-        index.add_definition(method1, Definition(location=sample_location))
-
-        # Query for functions named "test_func"
-        query = QueryByName(name="test_func", type_filter=FilterOption.FUNCTION)
-        results = index.handle_query(query)
-
-        assert len(results) == 1
-        assert results[0].func_like == func1
-
-    def test_query_by_name_method(self, sample_location):
-        """Test querying by method name."""
-        index = CrossRefIndex()
-        func1 = Function(name="test_func")
-        method1 = Method(name="test_func", class_name="TestClass")
-
-        index.add_definition(func1, Definition(location=sample_location))
-        index.add_definition(method1, Definition(location=sample_location))
-
-        # Query for methods named "test_func"
-        query = QueryByName(name="test_func", type_filter=FilterOption.METHOD)
-        results = index.handle_query(query)
-
-        assert len(results) == 1
-        assert results[0].func_like == method1
-
-    def test_query_by_name_all(self, sample_location):
-        """Test querying by name with no type filter."""
-        index = CrossRefIndex()
-        func1 = Function(name="test_func")
-        method1 = Method(name="test_func", class_name="TestClass")
-
-        index.add_definition(func1, Definition(location=sample_location))
-        index.add_definition(method1, Definition(location=sample_location))
-
-        # Query for all items named "test_func"
-        query = QueryByName(name="test_func", type_filter=FilterOption.ALL)
-        results = index.handle_query(query)
+    @pytest.fixture
+    def name_index(self, index, sample_location):
+        """Index holding a function and a method sharing a name, plus an unrelated function."""
+        index.add_definition(Function(name="test_func"), _def(sample_location))
+        index.add_definition(Function(name="other_func"), _def(sample_location))
+        index.add_definition(
+            Method(name="test_func", class_name="TestClass"), _def(sample_location)
+        )
+        return index
+
+    @pytest.mark.parametrize(
+        "type_filter, expected",
+        [
+            (FilterOption.FUNCTION, {Function(name="test_func")}),
+            (FilterOption.METHOD, {Method(name="test_func", class_name="TestClass")}),
+            (
+                FilterOption.ALL,
+                {Function(name="test_func"), Method(name="test_func", class_name="TestClass")},
+            ),
+        ],
+    )
+    def test_query_by_name(self, name_index, type_filter, expected):
+        """Test querying by name with each type filter."""
+        query = QueryByName(name="test_func", type_filter=type_filter)
+        results = name_index.handle_query(query)
 
-        assert len(results) == 2
-        func_likes = {result.func_like for result in results}
-        assert func1 in func_likes
-        assert method1 in func_likes
+        assert {result.func_like for result in results} == expected
+        assert len(results) == len(expected)
 
-    def test_query_by_name_regex(self, sample_location):
+    def test_query_by_name_regex(self, index, sample_location):
         """Test querying by regex pattern."""
-        index = CrossRefIndex()
         func1 = Function(name="test_func")
         func2 = Function(name="test_method")
         func3 = Function(name="other_func")
 
-        index.add_definition(func1, Definition(location=sample_location))
-        index.add_definition(func2, Definition(location=sample_location))
-        index.add_definition(func3, Definition(location=sample_location))
+        index.add_definition(func1, _def(sample_location))
+        index.add_definition(func2, _def(sample_location))
+        index.add_definition(func3, _def(sample_location))
 
         # Query for functions matching "test_.*"
         query = QueryByNameRegex(name_regex="test_.*", type_filter=FilterOption.ALL)
@@ -553,18 +626,15 @@ class TestCrossRefIndex:
         assert func2 in func_likes
         assert func3 not in func_likes
 
-    def test_query_invalid_regex(self):
+    def test_query_invalid_regex(self, index):
         """Test that invalid regex patterns raise ValueError."""
-        index = CrossRefIndex()
-
         query = QueryByNameRegex(name_regex="[invalid", type_filter=FilterOption.ALL)
-        with pytest.raises(ValueError, match="Invalid regex pattern"):
+        with pytest.raises(ValueError, match=_INVALID_REGEX_RE):
             index.handle_query(query)
 
-    def test_serialization_roundtrip(self, sample_function, sample_location):
+    def test_serialization_roundtrip(self, index, sample_function, sample_location):
         """Test that index can be serialized and deserialized."""
-        index = CrossRefIndex()
-        definition = Definition(location=sample_location)
+        definition = _def(sample_location)
         index.add_definition(sample_function, definition)
 
         # Serialize to IndexData
@@ -577,20 +647,17 @@ class TestCrossRefIndex:
         new_index.update_from_data(data)
 
         # Verify the data was restored
-        assert sample_function in new_index
         info = new_index.get_info(sample_function)
         assert len(info.definitions) == 1
-        restored_def = list(info.definitions)[0]
+        restored_def = info.definitions[0]
         assert restored_def.location == sample_location
 
-    def test_update_method(self, sample_function, sample_location, sample_location2):
+    def test_update_method(self, index, sample_function, sample_location, sample_location2):
         """Test the update method with mapping."""
-        index = CrossRefIndex()
-
         # Create FunctionLikeInfo with multiple definitions and references
-        def1 = Definition(location=sample_location)
-        def2 = Definition(location=sample_location2)
-        ref1 = Reference(location=sample_location)
+        def1 = _def(sample_location)
+        def2 = _def(sample_location2)
+        ref1 = _ref(sample_location)
 
         info = FunctionLikeInfo(definitions=[def1, def2], references=[ref1])
 
@@ -602,12 +669,10 @@ class TestCrossRefIndex:
         assert len(stored_info.definitions) == 2
         assert len(stored_info.references) == 1
 
-    def test_merge_on_duplicate_addition(self, sample_function, sample_location):
+    def test_merge_on_duplicate_addition(self, index, sample_function, sample_location):
         """Test that adding the same definition/reference multiple times merges properly."""
-        index = CrossRefIndex()
-
         # Add the same definition twice
-        definition = Definition(location=sample_location)
+        definition = _def(sample_location)
         index.add_definition(sample_function, definition)
         index.add_definition(sample_function, definition)
 
@@ -615,10 +680,8 @@ class TestCrossRefIndex:
         info = index.get_info(sample_function)
         assert len(info.definitions) == 1
 
-    def test_complex_cross_reference_scenario(self):
+    def test_complex_cross_reference_scenario(self, index):
         """Test a complex scenario with multiple functions calling each other."""
-        index = CrossRefIndex()
-
         # Create locations
         loc_main = make_position(Path("main.py"), 1, 0, 1, 10, 0, 10)
         loc_func_a = make_position(Path("main.py"), 5, 0, 5, 10, 50, 60)
@@ -636,8 +699,8 @@ class TestCrossRefIndex:
         main_def = Definition(
             location=loc_main,
             calls=[
-                SymbolReference(symbol=func_a, reference=PureReference(location=loc_call_a)),
-                SymbolReference(symbol=func_b, reference=PureReference(location=loc_call_b1)),
+                SymbolReference(symbol=func_a, reference=_pref(loc_call_a)),
+                SymbolReference(symbol=func_b, reference=_pref(loc_call_b1)),
             ],
         )
 
@@ -645,12 +708,12 @@ class TestCrossRefIndex:
         func_a_def = Definition(
             location=loc_func_a,
             calls=[
-                SymbolReference(symbol=func_b, reference=PureReference(location=loc_call_b2)),
+                SymbolReference(symbol=func_b, reference=_pref(loc_call_b2)),
             ],
         )
 
         # func_b() doesn't call anything
-        func_b_def = Definition(location=loc_func_b, calls=[])
+        func_b_def = _def(loc_func_b, calls=[])
 
         # Add all definitions
         index.add_definition(main_func, main_def)
@@ -664,35 +727,30 @@ class TestCrossRefIndex:
 
         # main should have 1 definition with 2 calls
         assert len(main_info.definitions) == 1
-        assert len(list(main_info.definitions)[0].calls) == 2
+        assert len(main_info.definitions[0].calls) == 2
 
         # func_a should have 1 definition with 1 call, and 1 reference (called by main)
         assert len(func_a_info.definitions) == 1
-        assert len(list(func_a_info.definitions)[0].calls) == 1
+        assert len(func_a_info.definitions[0].calls) == 1
         assert len(func_a_info.references) == 1
-        func_a_ref = list(func_a_info.references)[0]
+        func_a_ref = func_a_info.references[0]
         assert len(func_a_ref.called_by) == 1
         assert func_a_ref.called_by[0].symbol == main_func
 
         # func_b should have 1 definition with 0 calls, and 2 references (called by main and func_a)
         assert len(func_b_info.definitions) == 1
-        assert len(list(func_b_info.definitions)[0].calls) == 0
+        assert len(func_b_info.definitions[0].calls) == 0
         assert len(func_b_info.references) == 2
 
         # Check that func_b has the right callers
-        func_b_refs = list(func_b_info.references)
-        callers = set()
-        for ref in func_b_refs:
-            for caller in ref.called_by:
-                callers.add(caller.symbol)
+        func_b_refs = func_b_info.references
+        callers = {caller.symbol for ref in func_b_refs for caller in ref.called_by}
 
         assert main_func in callers
         assert func_a in callers
 
-    def test_str_and_repr(self, sample_function, sample_location):
+    def test_str_and_repr(self, index, sample_function, sample_location):
         """Test string representations of the index."""
-        index = CrossRefIndex()
-
         # Test empty index
         repr_str = repr(index)
         assert "CrossRefIndex" in repr_str
@@ -701,7 +759,7 @@ class TestCrossRefIndex:
         assert "total_references=0" in repr_str
 
         # Add some data
-        definition = Definition(location=sample_location)
+        definition = _def(sample_location)
         index.add_definition(sample_function, definition)
 
         # Test with data
@@ -709,10 +767,9 @@ class TestCrossRefIndex:
         assert "items=1" in repr_str
         assert "total_definitions=1" in repr_str
 
-    def test_query_full_definition_existing_function(self, sample_function, sample_location):
+    def test_query_full_definition_existing_function(self, index, sample_function, sample_location):
         """Test QueryFullDefinition for existing function definition."""
-        index = CrossRefIndex()
-        definition = Definition(location=sample_location)
+        definition = _def(sample_location)
         index.add_definition(sample_function, definition)
 
         pure_def = definition.to_pure()
@@ -728,14 +785,12 @@ class TestCrossRefIndex:
         assert len(response.info.references) == 0
 
     def test_query_full_definition_with_references(
-        self, sample_function, sample_location, sample_location2
+        self, index, sample_function, sample_location, sample_location2
     ):
         """Test QueryFullDefinition preserves all references for context."""
-        index = CrossRefIndex()
-
         # Add definition and references
-        definition = Definition(location=sample_location)
-        reference = Reference(location=sample_location2)
+        definition = _def(sample_location)
+        reference = _ref(sample_location2)
 
         index.add_definition(sample_function, definition)
         index.add_reference(sample_function, reference)
@@ -753,11 +808,10 @@ class TestCrossRefIndex:
         assert len(response.info.references) == 1
         assert response.info.references[0] == reference
 
-    def test_query_full_definition_non_existing_symbol(self, sample_location):
+    def test_query_full_definition_non_existing_symbol(self, index, sample_location):
         """Test QueryFullDefinition for non-existing symbol."""
-        index = CrossRefIndex()
         non_existing_func = Function(name="non_existing")
-        pure_def = PureDefinition(location=sample_location)
+        pure_def = _pdef(sample_location)
 
         query = QueryFullDefinition(symbol=non_existing_func, pure_definition=pure_def)
         results = index.handle_query(query)
@@ -765,15 +819,14 @@ class TestCrossRefIndex:
         assert len(results) == 0
 
     def test_query_full_definition_non_existing_definition(
-        self, sample_function, sample_location, sample_location2
+        self, index, sample_function, sample_location, sample_location2
     ):
         """Test QueryFullDefinition for existing symbol but non-existing definition."""
-        index = CrossRefIndex()
-        definition = Definition(location=sample_location)
+        definition = _def(sample_location)
         index.add_definition(sample_function, definition)
 
         # Create a PureDefinition that doesn't exist in the index
-        non_existing_pure_def = PureDefinition(location=sample_location2)
+        non_existing_pure_def = _pdef(sample_location2)
 
         query = QueryFullDefinition(symbol=sample_function, pure_definition=non_existing_pure_def)
         results = index.handle_query(query)
@@ -781,14 +834,12 @@ class TestCrossRefIndex:
         assert len(results) == 0
 
     def test_query_full_definition_multiple_definitions(
-        self, sample_function, sample_location, sample_location2
+        self, index, sample_function, sample_location, sample_location2
     ):
         """Test QueryFullDefinition when function has multiple definitions."""
-        index = CrossRefIndex()
-
         # Add multiple definitions for the same function
-        definition1 = Definition(location=sample_location)
-        definition2 = Definition(location=sample_location2)
+        definition1 = _def(sample_location)
+        definition2 = _def(sample_location2)
 
         index.add_definition(sample_function, definition1)
         index.add_definition(sample_function, definition2)
@@ -815,18 +866,16 @@ class TestCrossRefIndex:
         assert len(response2.info.definitions) == 1
         assert response2.info.definitions[0] == definition2
 
-    def test_query_full_definition_with_cross_references(self, sample_location, sample_location2):
+    def test_query_full_definition_with_cross_references(
+        self, index, sample_location, sample_location2
+    ):
         """Test QueryFullDefinition in a cross-referenced scenario."""
-        index = CrossRefIndex()
-
         caller_func = Function(name="caller")
         called_func = Function(name="called")
 
         # Create a definition that calls another function
-        symbol_ref = SymbolReference(
-            symbol=called_func, reference=PureReference(location=sample_location2)
-        )
-        caller_definition = Definition(location=sample_location, calls=[symbol_ref])
+        symbol_ref = SymbolReference(symbol=called_func, reference=_pref(sample_location2))
+        caller_definition = _def(sample_location, calls=[symbol_ref])
 
         # Add the definition
         index.add_definition(caller_func, caller_definition)
@@ -116,6 +116,55 @@ def test_find_full_definition_stale_mapping_rebuild_path():
     info = index.data[f]
     info.definitions.pop(pure)
 
-    # The fast path would see symbol but missing definition, triggering rebuild and yielding None
+    # The fast path sees the symbol but no definition: it drops only the stale entry
+    mapping_size = len(index._def_key_to_symbol)
     res = index.find_full_definition(pure)
     assert res is None
+    assert len(index._def_key_to_symbol) == mapping_size - 1
+    assert index.find_full_definition(pure) is None
+
+
+def test_find_full_definition_near_miss_keeps_mapping():
+    index = CrossRefIndex()
+    f = Function(name="foo")
+    d = Definition(location=make_loc("a.py", 1))
+    index.add_definition(f, d)
+
+    # Same file and byte span as d, but a different line: a miss that must not drop d's entry
+    near_miss = PureDefinition(
+        location=d.location.model_copy(update={"start_lineno": 2, "end_lineno": 2})
+    )
+    assert index.find_full_definition(near_miss) is None
+    assert index.find_full_definition(d.to_pure()) == (f, d)
+
+
+def test_find_full_definition_same_span_in_different_files():
+    index = CrossRefIndex()
+    f = Function(name="foo")
+    g = Function(name="bar")
+    d_a = Definition(location=make_loc("a.py", 4))
+    d_b = Definition(location=make_loc("b.py", 4))
+    index.add_definition(f, d_a)
+    index.add_definition(g, d_b)
+
+    # Same byte span, different files: each resolves to its own owner
+    assert index.find_full_definition(d_a.to_pure()) == (f, d_a)
+    assert index.find_full_definition(d_b.to_pure()) == (g, d_b)
+    # A path that was never indexed is a miss without touching the mapping
+    assert index.find_full_definition(PureDefinition(location=make_loc("c.py", 4))) is None
+
+
+def test_update_from_data_replaces_existing_symbol_definitions():
+    index = CrossRefIndex()
+    f = Function(name="foo")
+    old = Definition(location=make_loc("a.py", 1))
+    new = Definition(location=make_loc("a.py", 2))
+    index.add_definition(f, old)
+
+    source = CrossRefIndex()
+    source.add_definition(f, new)
+    index.update_from_data(source.as_data())
+
+    # The loaded entry replaces the symbol's info, and the mapping follows
+    assert index.find_full_definition(new.to_pure()) == (f, new)
+    assert index.find_full_definition(old.to_pure()) is None
@@ -1,9 +1,10 @@
-import tempfile
+import sqlite3
 from pathlib import Path
+from typing import Iterator
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Engine, create_engine, func, select
+from sqlalchemy.orm import Session, selectinload
 
 from code_index.index.persist.persist_sqlite import (
     OrmCodeLocation,
@@ -31,8 +32,8 @@ from code_index.models import (
 from code_index.utils.test import assert_index_data_equal
 
 
-# make locations a fixture
-@pytest.fixture
+# make locations a fixture; the shared fixtures are read-only, so they are built once
+@pytest.fixture(scope="module")
 def locations() -> list[CodeLocation]:
     return [
         CodeLocation(
@@ -48,7 +49,7 @@ def locations() -> list[CodeLocation]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_index_data(
     locations: list[CodeLocation],
 ) -> IndexData:
@@ -161,7 +162,7 @@ def sample_index_data(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_index_integration_data(
     locations: list[CodeLocation],
 ) -> IndexData:
@@ -173,25 +174,32 @@ def sample_index_integration_data(
 
     index = SimpleIndex()
 
-    def get_symbol(x: int) -> Function:
-        return Function(name=f"func_{x}")
+    # one Function per name, shared by every entry, call and caller that mentions it
+    symbols = {x: Function(name=f"func_{x}") for x in range(1, 11)}
 
-    def get_caller_def_location(x: int) -> CodeLocation:
-        return locations[x + 20]  # 21 through 30
+    # the definition location of each function, 21 through 30
+    def_locations = {x: locations[x + 20] for x in range(1, 11)}
+
+    # each function's definition as a caller, and its first reference as a callee; every
+    # call link below is a slice of these
+    caller_definitions = [
+        SymbolDefinition(symbol=symbols[j], definition=PureDefinition(location=def_locations[j]))
+        for j in range(1, 11)
+    ]
+    callee_references = [
+        SymbolReference(
+            symbol=symbols[j],
+            reference=PureReference(location=locations[j]),  # 1 through 10
+        )
+        for j in range(1, 11)
+    ]
 
     # insert 10 symbols, each with 2 references
     for i in range(1, 11):
-        func = get_symbol(i)
+        func = symbols[i]
 
         # each symbol is called by all later symbols
-        called_by = []
-        for j in range(i + 1, 11):
-            called_by.append(
-                SymbolDefinition(
-                    symbol=get_symbol(j),
-                    definition=PureDefinition(location=get_caller_def_location(j)),  # 21 through 30
-                )
-            )
+        called_by = caller_definitions[i:]
 
         index.add_reference(
             func,
@@ -205,19 +213,11 @@ def sample_index_integration_data(
         )
 
         # each function references all previous functions via definitions
-        definition_calls = []
-        for j in range(1, i):
-            prev_func = Function(name=f"func_{j}")
-            definition_calls.append(
-                SymbolReference(
-                    symbol=get_symbol(j),
-                    reference=PureReference(location=locations[j]),  # 1 through 10
-                )
-            )
+        definition_calls = callee_references[: i - 1]
         index.add_definition(
             func,
             Definition(
-                location=get_caller_def_location(i),  # 21 through 30
+                location=def_locations[i],
                 calls=definition_calls,
             ),
         )
@@ -225,109 +225,198 @@ def sample_index_integration_data(
     return index.as_data()
 
 
-# @pytest.mark.skip("WIP")
+@pytest.fixture(scope="class")
+def saved_sample_db(tmp_path_factory: pytest.TempPathFactory, sample_index_data: IndexData) -> Path:
+    """Database file holding sample_index_data, saved once for read-only assertions."""
+    path = tmp_path_factory.mktemp("sqlite") / "test_index.sqlite"
+    SqlitePersistStrategy().save(sample_index_data, path)
+    return path
+
+
+@pytest.fixture(scope="class")
+def saved_sample_engine(saved_sample_db: Path) -> Iterator[Engine]:
+    """One engine over saved_sample_db shared by the read-only tests, disposed afterwards."""
+    engine = create_engine(f"sqlite:///{str(saved_sample_db.resolve())}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="class")
+def saved_sample_symbols(saved_sample_engine: Engine) -> dict[str, OrmSymbol]:
+    """Symbols of saved_sample_db by name, with every relationship the tests walk loaded.
+
+    One eager query replaces a lazy-load round trip per relationship access; the returned
+    rows are detached but fully populated.
+    """
+    with Session(saved_sample_engine) as session:
+        return {
+            symbol_db.name: symbol_db
+            for symbol_db in session.scalars(
+                select(OrmSymbol).options(
+                    selectinload(OrmSymbol.definitions).options(
+                        selectinload(OrmDefinition.location),
+                        selectinload(OrmDefinition.internal_references).selectinload(
+                            OrmReference.symbol
+                        ),
+                    ),
+                    selectinload(OrmSymbol.references).selectinload(OrmReference.location),
+                )
+            )
+        }
+
+
 class TestSqlitePersistStrategy:
-    def test_save_simple_data(self, locations: list[CodeLocation], sample_index_data: IndexData):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            path = Path(temp_dir) / "test_index.sqlite"
-            strategy = SqlitePersistStrategy()
-            strategy.save(sample_index_data, path)
-
-            # Verify that the file was created
-            assert path.exists()
-
-            engine = create_engine(f"sqlite:///{str(path.resolve())}")
-            session_maker = sessionmaker(bind=engine)
-            session = session_maker()
-
-            try:
-                assert session.query(OrmSymbol).count() == 3  # func_1, func_2, func_3
-                assert session.query(OrmCodeLocation).count() == 7  # 7 different locations appeared
-                assert (
-                    session.query(OrmDefinition).count() == 3
-                )  # func_1, func_2, func_3 each has one definition
-                assert (
-                    session.query(OrmReference).count() == 4
-                )  # func_1 has 1 ref, func_2 has 1 ref, func_3 has 2 refs
-
-                # Verify the index-level metadata
-                metadata = session.query(OrmMetadata).one()
-                assert metadata.index_type == "test_index"
-
-                # Verify the data for func_1
-                func_1_db = session.query(OrmSymbol).filter_by(name="func_1").one()
-                assert func_1_db.symbol_type == SymbolType.FUNCTION
-                assert func_1_db.definitions.__len__() == 1
-                assert func_1_db.references.__len__() == 1
-                assert func_1_db.class_name is None
-
-                func_1_def = func_1_db.definitions[0]
-                assert func_1_def.location.file_path == str(locations[0].file_path)
-                func_1_ref = func_1_db.references[0]
-                assert func_1_ref.location.file_path == str(locations[1].file_path)
-
-                # Verify the data for func_2
-                func_2_db = session.query(OrmSymbol).filter_by(name="func_2").one()
-                assert func_2_db.symbol_type == SymbolType.FUNCTION
-                assert func_2_db.definitions.__len__() == 1
-                assert func_2_db.class_name is None
-
-                func_2_def: OrmDefinition = func_2_db.definitions[0]  # type: ignore
-                assert func_2_def.location.file_path == str(locations[2].file_path)
-                assert func_2_def.internal_references.__len__() == 1
-                assert func_2_def.internal_references[0].symbol.name == "func_1"
-                assert (
-                    func_2_def.internal_references[0] == func_1_ref
-                )  # should be the same row in the database
-
-                # Verify the data for func_3
-                func_3_db = session.query(OrmSymbol).filter_by(name="func_3").one()
-                assert func_3_db.symbol_type == SymbolType.METHOD
-                assert func_3_db.definitions.__len__() == 1
-                assert func_3_db.class_name == "ClassFoo"
-                func_3_def: OrmDefinition = func_3_db.definitions[0]  # type: ignore
-                assert func_3_def.location.file_path == str(locations[4].file_path)
-                assert func_3_def.internal_references.__len__() == 2
-                assert func_3_def.internal_references[0].symbol.name == "func_1"
-                assert func_3_def.internal_references[1].symbol.name == "func_2"
-
-            finally:
-                session.close()
-
-    def test_save_and_load_data(self, sample_index_data: IndexData):
+    def test_save_simple_data(
+        self,
+        saved_sample_db: Path,
+        saved_sample_engine: Engine,
+        saved_sample_symbols: dict[str, OrmSymbol],
+    ):
+        # Verify that the file was created
+        assert saved_sample_db.exists()
+
+        with Session(saved_sample_engine) as session:
+
+            def count_rows(model) -> int:
+                return session.scalar(select(func.count()).select_from(model))
+
+            assert count_rows(OrmSymbol) == 3  # func_1, func_2, func_3
+            assert count_rows(OrmCodeLocation) == 7  # 7 different locations appeared
+            assert count_rows(OrmDefinition) == 3  # func_1, func_2, func_3 each has one def
+            # func_1 has 1 ref, func_2 has 1 ref, func_3 has 2 refs
+            assert count_rows(OrmReference) == 4
+
+            # Verify the index-level metadata
+            metadata = session.query(OrmMetadata).one()
+            assert metadata.index_type == "test_index"
+
+        # func_2 calls func_1
+        func_1_ref = saved_sample_symbols["func_1"].references[0]
+        func_2_def: OrmDefinition = saved_sample_symbols["func_2"].definitions[0]  # type: ignore
+        assert func_2_def.internal_references.__len__() == 1
+        assert func_2_def.internal_references[0].symbol.name == "func_1"
+        assert (
+            func_2_def.internal_references[0] == func_1_ref
+        )  # should be the same row in the database
+
+        # func_3 calls func_1 and func_2
+        func_3_def: OrmDefinition = saved_sample_symbols["func_3"].definitions[0]  # type: ignore
+        assert func_3_def.internal_references.__len__() == 2
+        assert func_3_def.internal_references[0].symbol.name == "func_1"
+        assert func_3_def.internal_references[1].symbol.name == "func_2"
+
+    @pytest.mark.parametrize(
+        "name, symbol_type, class_name, def_loc_idx, ref_loc_indices",
+        [
+            ("func_1", SymbolType.FUNCTION, None, 0, [1]),
+            ("func_2", SymbolType.FUNCTION, None, 2, [3]),
+            ("func_3", SymbolType.METHOD, "ClassFoo", 4, [5, 6]),
+        ],
+    )
+    def test_save_simple_data_symbol_rows(
+        self,
+        locations: list[CodeLocation],
+        saved_sample_symbols: dict[str, OrmSymbol],
+        name: str,
+        symbol_type: SymbolType,
+        class_name: str | None,
+        def_loc_idx: int,
+        ref_loc_indices: list[int],
+    ):
+        symbol_db = saved_sample_symbols[name]
+        assert symbol_db.symbol_type == symbol_type
+        assert symbol_db.class_name == class_name
+
+        assert symbol_db.definitions.__len__() == 1
+        assert symbol_db.definitions[0].location.file_path == str(locations[def_loc_idx].file_path)
+
+        assert sorted(ref.location.file_path for ref in symbol_db.references) == [
+            str(locations[i].file_path) for i in ref_loc_indices
+        ]
+
+    def test_save_and_load_data(self, tmp_path: Path, sample_index_data: IndexData):
         """测试保存和加载数据的完整流程，验证数据的一致性"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            path = Path(temp_dir) / "test_index.sqlite"
-            strategy = SqlitePersistStrategy()
+        path = tmp_path / "test_index.sqlite"
+        strategy = SqlitePersistStrategy()
 
-            # 保存数据
-            strategy.save(sample_index_data, path)
-            assert path.exists()
+        # 保存数据
+        strategy.save(sample_index_data, path)
+        assert path.exists()
 
-            # 加载数据
-            loaded_data = strategy.load(path)
+        # 加载数据
+        loaded_data = strategy.load(path)
 
-            # 使用工具函数进行深度比较，不考虑列表顺序
-            assert_index_data_equal(
-                loaded_data, sample_index_data, "Loaded data does not match original data"
-            )
+        # 使用工具函数进行深度比较，不考虑列表顺序
+        assert_index_data_equal(
+            loaded_data, sample_index_data, "Loaded data does not match original data"
+        )
 
-    def test_save_integration_data(self, sample_index_integration_data: IndexData):
+    def test_save_integration_data(self, tmp_path: Path, sample_index_integration_data: IndexData):
         """测试保存集成数据的完整流程，验证数据的一致性"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            path = Path(temp_dir) / "test_index_integration.sqlite"
-            strategy = SqlitePersistStrategy()
-
-            # 保存数据
-            strategy.save(sample_index_integration_data, path)
-            assert path.exists()
-
-            # 加载数据
-            loaded_data = strategy.load(path)
-
-            # 使用工具函数进行深度比较，不考虑列表顺序
-            assert_index_data_equal(
-                loaded_data,
-                sample_index_integration_data,
-                "Loaded integration data does not match original data",
-            )
+        path = tmp_path / "test_index_integration.sqlite"
+        strategy = SqlitePersistStrategy()
+
+        # 保存数据
+        strategy.save(sample_index_integration_data, path)
+        assert path.exists()
+
+        # 加载数据
+        loaded_data = strategy.load(path)
+
+        # 使用工具函数进行深度比较，不考虑列表顺序
+        assert_index_data_equal(
+            loaded_data,
+            sample_index_integration_data,
+            "Loaded integration data does not match original data",
+        )
+
+    def test_save_and_load_empty_data(self, tmp_path: Path):
+        """测试保存和加载没有任何符号的索引"""
+        path = tmp_path / "test_index_empty.sqlite"
+        strategy = SqlitePersistStrategy()
+
+        strategy.save(IndexData(type="empty_index", data=[]), path)
+        loaded_data = strategy.load(path)
+
+        assert loaded_data.type == "empty_index"
+        assert loaded_data.data == []
+
+    @pytest.mark.parametrize("memory_pragmas", [True, False])
+    def test_save_leaves_default_journal_mode(
+        self, tmp_path: Path, sample_index_data: IndexData, memory_pragmas: bool
+    ):
+        """测试保存后的数据库文件仍是默认的 DELETE 日志模式，可以只读打开"""
+        path = tmp_path / "test_index_journal.sqlite"
+        SqlitePersistStrategy(memory_pragmas=memory_pragmas).save(sample_index_data, path)
+
+        # a WAL database needs a writable directory for its -wal/-shm files even to be read
+        assert not path.with_name(f"{path.name}-wal").exists()
+        assert not path.with_name(f"{path.name}-journal").exists()
+        connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+            assert connection.execute("SELECT COUNT(*) FROM symbols").fetchone() == (3,)
+        finally:
+            connection.close()
+
+    def test_load_releases_database_file(
+        self, tmp_path: Path, sample_index_data: IndexData, monkeypatch: pytest.MonkeyPatch
+    ):
+        """测试加载结束后不再持有数据库连接"""
+        path = tmp_path / "test_index_release.sqlite"
+        strategy = SqlitePersistStrategy()
+        strategy.save(sample_index_data, path)
+
+        engines: list[Engine] = []
+        get_engine = strategy.get_engine
+
+        def recording_get_engine(*args, **kwargs) -> Engine:
+            engines.append(get_engine(*args, **kwargs))
+            return engines[-1]
+
+        monkeypatch.setattr(strategy, "get_engine", recording_get_engine)
+        strategy.load(path)
+
+        # without dispose() the closed session's connection would stay checked in to the pool
+        (engine,) = engines
+        assert engine.pool.checkedin() == 0
@@ -208,6 +208,55 @@ class TestSimpleIndexQuery:
         assert len(response.info.references) == 1
         assert response.info.references[0] == self.ref2
 
+    def test_query_by_name_repeated_adds_listed_once(self):
+        """Test QueryByName returns a symbol once however many times it was added."""
+        self.index.add_definition(self.func2, self.def3)
+        self.index.add_reference(self.func2, self.ref1)
+
+        results = self.index.handle_query(QueryByName(name="another_func"))
+
+        assert [r.func_like for r in results] == [self.func2]
+        assert len(results[0].info.definitions) == 2
+        assert len(results[0].info.references) == 2
+
+    def test_query_by_name_after_setitem_and_update(self):
+        """Test QueryByName finds symbols stored via __setitem__ and update."""
+        new_func = Function(name="new_func")
+        new_method = Method(name="new_func", class_name="NewClass")
+        self.index[new_func] = FunctionLikeInfo(definitions=[self.def2])
+        self.index.update({new_method: FunctionLikeInfo(references=[self.ref1])})
+        # replacing the info of an existing key must not list it twice
+        self.index[new_func] = FunctionLikeInfo(definitions=[self.def3])
+
+        results = self.index.handle_query(QueryByName(name="new_func"))
+
+        assert [r.func_like for r in results] == [new_func, new_method]
+        assert results[0].info.definitions == [self.def3]
+
+    def test_query_by_name_after_update_from_data(self):
+        """Test QueryByName on an index rebuilt from another index's data."""
+        rebuilt = SimpleIndex()
+        rebuilt.update_from_data(self.index.as_data())
+
+        results = rebuilt.handle_query(QueryByName(name="test_func"))
+
+        assert {r.func_like for r in results} == {self.func1, self.method2}
+
+    def test_query_by_name_after_delitem(self):
+        """Test QueryByName no longer returns symbols removed from the index."""
+        del self.index[self.func1]
+
+        results = self.index.handle_query(QueryByName(name="test_func"))
+        assert [r.func_like for r in results] == [self.method2]
+
+        del self.index[self.method2]
+        assert self.index.handle_query(QueryByName(name="test_func")) == []
+
+        # a removed symbol can be added back
+        self.index.add_definition(self.func1, self.def1)
+        results = self.index.handle_query(QueryByName(name="test_func"))
+        assert [r.func_like for r in results] == [self.func1]
+
     def test_multiple_definitions_same_function(self):
         """Test function with multiple definitions."""
         # Add another definition for func1
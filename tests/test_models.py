@@ -0,0 +1,112 @@
+"""Tests for the core pydantic models in code_index.models."""
+
+import copy
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+from code_index.models import CodeLocation, Definition, Function, Method, PureDefinition
+
+
+def make_loc(fname: str, ln: int) -> CodeLocation:
+    return CodeLocation(
+        file_path=Path(fname),
+        start_lineno=ln,
+        start_col=0,
+        end_lineno=ln,
+        end_col=10,
+        start_byte=ln * 10,
+        end_byte=ln * 10 + 10,
+    )
+
+
+class TestCachedHash:
+    """Tests for the cached hash on frozen key models."""
+
+    def test_equal_models_hash_equal(self):
+        """Equal instances hash the same whether or not their hash is cached yet."""
+        loc1, loc2 = make_loc("a.py", 1), make_loc("a.py", 1)
+        hash(loc1)
+
+        assert loc1 == loc2
+        assert hash(loc1) == hash(loc2)
+        assert hash(PureDefinition(location=loc1)) == hash(PureDefinition(location=loc2))
+        assert hash(Function(name="f")) == hash(Function(name="f"))
+        assert hash(Method(name="m", class_name="C")) == hash(Method(name="m", class_name="C"))
+
+    def test_cached_hash_not_serialized(self):
+        """The cached hash does not leak into dumps or equality."""
+        loc = make_loc("a.py", 1)
+        hash(loc)
+
+        assert "_hash" not in loc.model_dump()
+        assert CodeLocation.model_validate_json(loc.model_dump_json()) == loc
+
+    def test_model_copy_with_update_rehashes(self):
+        """A copy with updated fields does not reuse the original's cached hash."""
+        loc = make_loc("a.py", 1)
+        hash(loc)
+
+        moved = loc.model_copy(update={"start_byte": 999})
+
+        assert hash(moved) == hash(make_loc("a.py", 1).model_copy(update={"start_byte": 999}))
+        assert {loc: "old"}.get(moved) is None
+
+
+class TestInstanceCachesNotCopied:
+    """Tests that per-process caches do not travel with pickles and deep copies."""
+
+    def test_pickle_round_trip_matches_fresh_key(self):
+        """An unpickled key drops its cached hash and is found in a set of fresh keys."""
+        loc = make_loc("a.py", 1)
+        definition = Definition(location=loc)
+        hash(definition.to_pure())
+
+        restored_loc = pickle.loads(pickle.dumps(loc))
+        restored_def = pickle.loads(pickle.dumps(definition))
+
+        assert "_hash" not in restored_loc.__dict__
+        assert "_pure" not in restored_def.__dict__
+        assert restored_loc in {make_loc("a.py", 1)}
+        assert restored_def.to_pure() in {PureDefinition(location=make_loc("a.py", 1))}
+
+    def test_pickle_from_other_process_matches_fresh_key(self):
+        """A key pickled under a different hash seed is still found in a set of fresh keys."""
+        script = (
+            "import pickle, sys\n"
+            "from pathlib import Path\n"
+            "from code_index.models import CodeLocation, Definition\n"
+            "loc = CodeLocation(file_path=Path('a.py'), start_lineno=1, start_col=0,\n"
+            "                   end_lineno=1, end_col=10, start_byte=10, end_byte=20)\n"
+            "definition = Definition(location=loc)\n"
+            "hash(loc), hash(definition.to_pure())\n"
+            "sys.stdout.buffer.write(pickle.dumps((loc, definition)))\n"
+        )
+        seed = "1" if os.environ.get("PYTHONHASHSEED") != "1" else "2"
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": os.pathsep.join(sys.path)},
+            capture_output=True,
+            check=True,
+        )
+
+        loc, definition = pickle.loads(result.stdout)
+
+        assert loc in {make_loc("a.py", 1)}
+        assert definition.to_pure() in {PureDefinition(location=make_loc("a.py", 1))}
+
+    def test_deepcopy_drops_cached_values(self):
+        """A deep copy recomputes its cached values instead of carrying them over."""
+        loc = make_loc("a.py", 1)
+        definition = Definition(location=loc)
+        hash(loc), hash(definition.to_pure())
+
+        copied_loc = copy.deepcopy(loc)
+        copied_def = copy.deepcopy(definition)
+
+        assert "_hash" not in copied_loc.__dict__
+        assert "_pure" not in copied_def.__dict__
+        assert copied_loc in {make_loc("a.py", 1)}
+        assert copied_def.to_pure() in {PureDefinition(location=make_loc("a.py", 1))}
@@ -89,6 +89,23 @@ class TestEnhancedJSONEncoder:
         assert decoded["nested_data"]["name"] == "nested"
         assert decoded["numbers"] == [1, 2, 3, 4]
 
+    def test_encode_single_and_empty_field_dataclass(self):
+        """测试单字段和无字段数据类的编码"""
+
+        @dataclass
+        class Single:
+            only: int
+
+        @dataclass
+        class Empty:
+            pass
+
+        assert json.loads(json.dumps(Single(only=1), cls=EnhancedJSONEncoder)) == {
+            "only": 1,
+            "__class__": "Single",
+        }
+        assert json.loads(json.dumps(Empty(), cls=EnhancedJSONEncoder)) == {"__class__": "Empty"}
+
 
 class TestCustomJSONDecoder:
     """测试自定义JSON解码器"""
@@ -115,6 +132,17 @@ class TestCustomJSONDecoder:
         assert str(result["file_path"]) == "/home/user/document.txt"
         assert result["other"] == "value"
 
+    def test_decode_repeated_paths_are_shared(self):
+        """测试共享 path_cache 时相同路径字符串解码为同一个Path对象"""
+        path_cache = {}
+        first = custom_json_decoder({"file_path": "/src/a.py"}, path_cache=path_cache)
+        second = custom_json_decoder({"file_path": "/src/a.py"}, path_cache=path_cache)
+        other = custom_json_decoder({"file_path": "/src/a.py"}, path_cache={})
+
+        assert first["file_path"] is second["file_path"]
+        assert other["file_path"] == first["file_path"]
+        assert other["file_path"] is not first["file_path"]
+
     def test_decode_unregistered_class_non_strict(self):
         """测试在非严格模式下解码未注册的类"""
         data = {"__class__": "UnregisteredClass", "field1": "value1", "field2": 123}
@@ -216,6 +244,18 @@ class TestFileOperations:
             assert loaded_data["entry2"] == data2
             assert loaded_data["metadata"] == {"version": "1.0", "count": 2}
 
+    def test_load_shares_repeated_paths(self):
+        """测试一次加载中相同的路径解码为同一个Path对象"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "paths.json"
+            dump_index_to_json(
+                {"a": {"file_path": "/src/a.py"}, "b": {"file_path": "/src/a.py"}}, output_file
+            )
+
+            loaded = load_index_from_json(output_file)
+
+            assert loaded["a"]["file_path"] is loaded["b"]["file_path"]
+
     def test_load_with_strict_mode(self):
         """测试在严格模式下加载包含未注册类的文件"""
         with tempfile.TemporaryDirectory() as temp_dir: